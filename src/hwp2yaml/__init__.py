@@ -10,6 +10,7 @@ from .batch import BatchProcessor
 from .exporter import YAMLExporter
 from .utils import (
     is_hwpx,
+    iter_hwp_files,
     extract_hwpx_text,
     extract_hwpx_structure,
     hwpx_structure_to_flat_text,
@@ -67,6 +68,7 @@ __all__ = [
     "extract_hwp5_structure",
     # Utils
     "is_hwpx",
+    "iter_hwp_files",
     "extract_hwpx_text",
     "extract_hwpx_structure",
     "hwpx_structure_to_flat_text",
@@ -3,22 +3,95 @@
 import os
 import json
 import signal
-from pathlib import Path
+from collections import deque
+from collections.abc import Iterable, Sequence
 from datetime import datetime
-from concurrent.futures import ProcessPoolExecutor, as_completed, TimeoutError
-from typing import Callable
+from functools import lru_cache
+from itertools import chain, repeat
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Iterator
 from multiprocessing import cpu_count
 
 from tqdm import tqdm
 
 from .extractor import extract_hwp_text
 from .models import ExtractResult, BatchResult
-from .constants import TIMEOUT_SECONDS
+from .constants import TIMEOUT_SECONDS, LARGE_FILE_BYTES, PROGRESS_MININTERVAL
+from .utils import iter_hwp_files
 
+# orjson 사용 (미설치 시 표준 json)
+try:
+    from orjson import loads as _loads_json
+except ImportError:
+    _loads_json = json.loads
 
-def _worker_extract(filepath: str) -> ExtractResult:
-    """워커 프로세스에서 실행되는 추출 함수"""
-    return extract_hwp_text(filepath)
+
+class _ExtractTimeout(BaseException):
+    """워커 내부 타임아웃 (추출기의 except Exception에 잡히지 않도록 BaseException)"""
+
+
+def _raise_timeout(signum, frame) -> None:
+    raise _ExtractTimeout()
+
+
+def _pool_init() -> None:
+    """워커 프로세스 초기화 (Ctrl+C는 부모 프로세스에서만 처리)"""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    if hasattr(signal, "SIGALRM"):
+        signal.signal(signal.SIGALRM, _raise_timeout)
+
+
+def _worker_extract(filepath: str, timeout: int = 0) -> ExtractResult:
+    """
+    워커 프로세스에서 실행되는 추출 함수
+
+    파일당 타임아웃은 워커 내부에서 SIGALRM으로 적용 (POSIX 전용).
+    예외는 실패 결과로 변환하여 반환.
+    """
+    use_alarm = timeout > 0 and hasattr(signal, "SIGALRM")
+    if use_alarm:
+        signal.alarm(timeout)
+    try:
+        # 해제 직전에 울린 알람도 아래 except에서 잡히도록 try 안에서 해제
+        try:
+            result = extract_hwp_text(filepath)
+        finally:
+            if use_alarm:
+                signal.alarm(0)
+    except _ExtractTimeout:
+        return _failed_result(filepath, f"타임아웃 ({timeout}초)")
+    except Exception as e:
+        return _failed_result(filepath, str(e))
+    return result
+
+
+def _split_by_size(files: list[str]) -> tuple[list[str], list[str]]:
+    """파일 크기 기준 분할 → (큰 파일 내림차순, 작은 파일 입력 순서)"""
+    large: list[tuple[int, str]] = []
+    small: list[str] = []
+    for filepath in files:
+        try:
+            size = os.stat(filepath).st_size
+        except OSError:
+            size = 0
+        if size >= LARGE_FILE_BYTES:
+            large.append((size, filepath))
+        else:
+            small.append(filepath)
+    large.sort(key=lambda item: item[0], reverse=True)
+    return [filepath for _, filepath in large], small
+
+
+def _failed_result(filepath: str, error: str) -> ExtractResult:
+    """실패 결과 생성"""
+    return ExtractResult(
+        filepath=filepath,
+        success=False,
+        text=None,
+        method="failed",
+        error=error,
+    )
 
 
 class BatchProcessor:
@@ -26,6 +99,9 @@ class BatchProcessor:
     HWP 파일 배치 처리기
 
     병렬 처리로 다수의 HWP 파일에서 텍스트 추출
+
+    워커 풀은 최초 처리 시 생성되어 이후 호출에서 재사용됨.
+    사용 후 close() 호출 또는 with 문 사용 권장.
     """
 
     def __init__(
@@ -45,85 +121,176 @@ class BatchProcessor:
         self.workers = workers
         self.timeout = timeout
         self.metadata_mapper = metadata_mapper
+        self._executor: ProcessPoolExecutor | None = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """워커 풀 반환 (최초 호출 시 생성)"""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_pool_init,
+            )
+        return self._executor
+
+    def close(self) -> None:
+        """워커 풀 종료"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _discard_executor(self) -> None:
+        """비정상 종료된 워커 풀 폐기 (남은 작업 취소, 대기하지 않음)"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def __enter__(self) -> "BatchProcessor":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def process_files_iter(
+        self,
+        files: Iterable[str],
+        progress: bool = True,
+    ) -> Iterator[ExtractResult]:
+        """
+        파일 목록 처리 (결과를 하나씩 반환)
+
+        결과를 리스트에 모으지 않으므로 대량 배치에서도 메모리 일정.
+
+        목록(Sequence)이면 큰 파일을 먼저 1개씩 전송하고 작은 파일은 청크 단위로
+        묶어 전송 (마지막에 큰 파일 하나가 남아 다른 워커가 노는 현상 방지).
+        결과 순서: 큰 파일(크기 내림차순) → 작은 파일(입력 순서).
+
+        제너레이터 등 길이를 모르는 이터러블이면 받는 즉시 전송하여
+        파일 탐색과 추출을 겹쳐 실행 (결과는 입력 순서).
+        이 경우 큰 파일 우선 전송, 청크 전송, 진행률 전체 개수는 적용되지 않음
+        (필요하면 list로 변환하여 전달).
+
+        Args:
+            files: HWP 파일 경로 목록 또는 이터러블
+            progress: 진행률 표시 여부
+
+        Yields:
+            ExtractResult 객체
+        """
+        if isinstance(files, Sequence):
+            total = len(files)
+            executor = self._get_executor()
+
+            large, small = _split_by_size(files)
+            ordered = large + small
+
+            # 작은 파일 다수일 때 future/pickle 왕복을 줄이기 위해 청크 단위 전송
+            chunksize = max(1, len(small) // (self.workers * 8))
+            iterator = chain(
+                executor.map(_worker_extract, large, repeat(self.timeout, len(large))),
+                executor.map(
+                    _worker_extract, small, repeat(self.timeout, len(small)),
+                    chunksize=chunksize,
+                ),
+            )
+        else:
+            total = None
+            ordered = []
+            iterator = self._iter_stream(files)
+
+        # 진행률 표시
+        if progress:
+            iterator = tqdm(
+                iterator, total=total, desc="HWP 추출",
+                mininterval=PROGRESS_MININTERVAL,
+            )
+
+        metadata_mapper = self.metadata_mapper
+        done = 0
+        try:
+            for result in iterator:
+                # 외부 메타데이터 연결 (매퍼 예외는 해당 파일만 실패 처리)
+                if metadata_mapper and result.success:
+                    try:
+                        result.external = metadata_mapper(result.filepath)
+                    except Exception as e:
+                        result = _failed_result(result.filepath, str(e))
+
+                done += 1
+                yield result
+
+        except Exception as e:
+            # 워커 비정상 종료: 다음 호출 시 풀 재생성
+            if isinstance(e, BrokenProcessPool):
+                self._discard_executor()
+            # map은 첫 예외에서 중단되므로 남은 파일은 실패 처리
+            for filepath in ordered[done:]:
+                yield _failed_result(filepath, str(e))
+
+    def _iter_stream(self, files: Iterable[str]) -> Iterator[ExtractResult]:
+        """
+        이터러블 순서대로 제출하며 결과 반환
+
+        진행 중인 작업은 워커 수의 2배로 제한 (future 무한 누적 방지)
+        """
+        executor = self._get_executor()
+        limit = self.workers * 2
+        pending: deque = deque()
+        files = iter(files)
+
+        try:
+            for filepath in files:
+                pending.append((filepath, executor.submit(_worker_extract, filepath, self.timeout)))
+                if len(pending) >= limit:
+                    yield pending[0][1].result()
+                    pending.popleft()
+            while pending:
+                yield pending[0][1].result()
+                pending.popleft()
+
+        except Exception as e:
+            # 워커 비정상 종료: 다음 호출 시 풀 재생성
+            if isinstance(e, BrokenProcessPool):
+                self._discard_executor()
+            # 결과를 받지 못한 파일과 아직 제출하지 않은 파일은 실패 처리
+            for filepath, future in pending:
+                future.cancel()
+                yield _failed_result(filepath, str(e))
+            for filepath in files:
+                yield _failed_result(filepath, str(e))
 
     def process_files(
         self,
-        files: list[str],
+        files: Iterable[str],
         progress: bool = True,
     ) -> BatchResult:
         """
         파일 목록 처리
 
         Args:
-            files: HWP 파일 경로 목록
+            files: HWP 파일 경로 목록 또는 이터러블
             progress: 진행률 표시 여부
 
         Returns:
             BatchResult 객체
         """
-        total = len(files)
         success = 0
         failed = 0
         results: list[ExtractResult] = []
 
         started_at = datetime.now()
 
-        with ProcessPoolExecutor(max_workers=self.workers) as executor:
-            # 작업 제출
-            future_to_file = {
-                executor.submit(_worker_extract, f): f for f in files
-            }
+        for result in self.process_files_iter(files, progress=progress):
+            results.append(result)
 
-            # 진행률 표시
-            iterator = as_completed(future_to_file)
-            if progress:
-                iterator = tqdm(iterator, total=total, desc="HWP 추출")
-
-            for future in iterator:
-                filepath = future_to_file[future]
-
-                try:
-                    result = future.result(timeout=self.timeout)
-
-                    # 외부 메타데이터 병합
-                    if self.metadata_mapper and result.metadata:
-                        external_meta = self.metadata_mapper(filepath)
-                        if external_meta and result.metadata:
-                            # HWPMetadata에 추가 정보 저장 (확장)
-                            if not hasattr(result.metadata, 'external'):
-                                object.__setattr__(result.metadata, 'external', external_meta)
-
-                    results.append(result)
-
-                    if result.success:
-                        success += 1
-                    else:
-                        failed += 1
-
-                except TimeoutError:
-                    failed += 1
-                    results.append(ExtractResult(
-                        filepath=filepath,
-                        success=False,
-                        text=None,
-                        method="failed",
-                        error=f"타임아웃 ({self.timeout}초)",
-                    ))
-
-                except Exception as e:
-                    failed += 1
-                    results.append(ExtractResult(
-                        filepath=filepath,
-                        success=False,
-                        text=None,
-                        method="failed",
-                        error=str(e),
-                    ))
+            if result.success:
+                success += 1
+            else:
+                failed += 1
 
         finished_at = datetime.now()
 
         return BatchResult(
-            total=total,
+            total=success + failed,
             success=success,
             failed=failed,
             results=results,
@@ -148,17 +315,15 @@ class BatchProcessor:
         Returns:
             BatchResult 객체
         """
-        path = Path(directory)
+        file_paths = list(iter_hwp_files(directory, recursive))
 
-        if recursive:
-            files = list(path.rglob("*.hwp"))
-        else:
-            files = list(path.glob("*.hwp"))
+        return self.process_files(file_paths, progress=progress)
 
-        # 문자열 경로로 변환
-        file_paths = [str(f) for f in files]
 
-        return self.process_files(file_paths, progress=progress)
+@lru_cache(maxsize=4096)
+def _article_key(filename: str) -> str:
+    """파일명에서 article_id 추출 (예: "133695_0.hwp" → "133695")"""
+    return filename.split("_", 1)[0].split(".", 1)[0]
 
 
 class MetadataMapper:
@@ -183,15 +348,16 @@ class MetadataMapper:
         if not os.path.isfile(filepath):
             return
 
-        with open(filepath, "r", encoding="utf-8") as f:
+        with open(filepath, "rb") as f:
             for line in f:
                 try:
-                    data = json.loads(line.strip())
+                    data = _loads_json(line)
                     # article_id 또는 파일명으로 키 생성
                     key = self._make_key(data)
                     if key:
                         self._mapping[key] = data
-                except json.JSONDecodeError:
+                except ValueError:
+                    # JSON 오류 (표준 json은 잘못된 UTF-8에서 UnicodeDecodeError)
                     continue
 
     def _make_key(self, data: dict) -> str | None:
@@ -213,18 +379,10 @@ class MetadataMapper:
             메타데이터 딕셔너리 (없으면 빈 딕셔너리)
         """
         filename = os.path.basename(filepath)
+        mapping = self._mapping
 
-        # 파일명에서 article_id 추출 시도
-        # 예: "133695_0.hwp" → "133695"
-        base = filename.split("_")[0].split(".")[0]
-
-        if base in self._mapping:
-            return self._mapping[base]
-
-        if filename in self._mapping:
-            return self._mapping[filename]
-
-        return {}
+        # article_id 우선, 없으면 파일명으로 조회
+        return mapping.get(_article_key(filename)) or mapping.get(filename) or {}
 
     def __call__(self, filepath: str) -> dict:
         """함수처럼 호출 가능"""
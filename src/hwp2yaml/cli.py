@@ -5,11 +5,13 @@ import os
 import sys
 import json
 import argparse
+from itertools import chain
 from pathlib import Path
 
 from .extractor import extract_hwp_text
 from .batch import BatchProcessor, MetadataMapper
 from .exporter import YAMLExporter
+from .utils import iter_hwp_files
 
 
 def cmd_extract(args):
@@ -48,23 +50,32 @@ def cmd_batch(args):
     if args.filelist:
         with open(args.filelist, "r", encoding="utf-8") as f:
             files = [line.strip() for line in f if line.strip()]
-    else:
-        files = []
-        for directory in args.directories:
-            path = Path(directory)
-            if args.recursive:
-                files.extend(str(f) for f in path.rglob("*.hwp"))
-            else:
-                files.extend(str(f) for f in path.glob("*.hwp"))
-
-    if not files:
-        print("✗ 처리할 HWP 파일이 없음", file=sys.stderr)
-        return 1
 
-    print(f"📁 {len(files)}개 파일 처리 시작...")
+        if not files:
+            print("✗ 처리할 HWP 파일이 없음", file=sys.stderr)
+            return 1
+
+        print(f"📁 {len(files)}개 파일 처리 시작...")
+    else:
+        # 디렉토리는 순회하면서 바로 처리 (전체 목록을 먼저 만들지 않음)
+        # 대신 큰 파일 우선 전송/청크 전송/진행률 전체 개수는 적용되지 않음
+        files = (
+            filepath
+            for directory in args.directories
+            for filepath in iter_hwp_files(directory, args.recursive)
+        )
+
+        first = next(files, None)
+        if first is None:
+            print("✗ 처리할 HWP 파일이 없음", file=sys.stderr)
+            return 1
+        files = chain((first,), files)
+
+        print("📁 파일 처리 시작...")
 
     # 처리 실행
     result = processor.process_files(files, progress=not args.quiet)
+    processor.close()
 
     # 결과 출력
     print(f"\n📊 결과: 성공 {result.success}/{result.total} ({result.success_rate:.1%})")
@@ -77,11 +88,11 @@ def cmd_batch(args):
         exporter = YAMLExporter(str(output_dir))
 
         if args.format == "yaml":
-            saved = exporter.export_batch(result, metadata_mapper)
+            saved = exporter.export_batch(result)
             print(f"💾 YAML 저장: {len(saved)}개 → {output_dir}")
         else:  # jsonl
             output_file = output_dir / "training_data.jsonl"
-            count = exporter.export_batch_jsonl(result, str(output_file), metadata_mapper)
+            count = exporter.export_batch_jsonl(result, str(output_file))
             print(f"💾 JSONL 저장: {count}개 → {output_file}")
 
         # 실패 로그
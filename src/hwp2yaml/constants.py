@@ -93,3 +93,9 @@ DEFAULT_ENCODING = "utf-16-le"
 # 제한
 MAX_FILE_SIZE_MB = 50
 TIMEOUT_SECONDS = 30
+
+# 배치 스케줄링 (이 크기 이상은 큰 파일로 먼저, 개별 전송)
+LARGE_FILE_BYTES = 64 * 1024
+
+# 진행률 표시 최소 갱신 간격 (초, 대량 배치에서 터미널 쓰기 횟수 제한)
+PROGRESS_MININTERVAL = 0.5
@@ -2,14 +2,48 @@
 
 import os
 import json
+import functools
 from pathlib import Path
 from datetime import datetime
-from typing import Callable
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Iterable
 
 import yaml
 
 from .models import ExtractResult, BatchResult, TrainingData
 
+# libyaml C 이미터 사용 (미설치 시 순수 Python 구현)
+try:
+    from yaml import CSafeDumper as _YAMLDumper
+except ImportError:
+    from yaml import SafeDumper as _YAMLDumper
+
+# orjson 사용 (미설치 시 표준 json, 두 경로 모두 같은 출력: 공백 없는 구분자, 비문자열 키 허용)
+try:
+    import orjson
+
+    def _dumps_json(obj: dict) -> bytes:
+        """JSON 직렬화 (UTF-8 바이트)"""
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+except ImportError:
+    def _dumps_json(obj: dict) -> bytes:
+        """JSON 직렬화 (UTF-8 바이트)"""
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+# JSONL 출력 버퍼 크기
+_JSONL_BUFFER_SIZE = 1 << 20
+
+
+def _iter_results(
+    batch_result: BatchResult | Iterable[ExtractResult],
+) -> Iterable[ExtractResult]:
+    """BatchResult 또는 ExtractResult 이터러블에서 결과 순회"""
+    if isinstance(batch_result, BatchResult):
+        return batch_result.results
+    return batch_result
+
 
 class YAMLExporter:
     """
@@ -38,16 +72,31 @@ class YAMLExporter:
 
         self.category_detector = category_detector or self._default_category
 
-    @staticmethod
-    def _default_category(filepath: str) -> str:
+        # YAML 직렬화 옵션 고정 (문서마다 키워드 인자 재구성 방지)
+        self._dump = functools.partial(
+            yaml.dump,
+            Dumper=_YAMLDumper,
+            allow_unicode=True,
+            default_flow_style=False,
+            sort_keys=False,
+        )
+
+    # 경로 키워드 → 카테고리 (앞쪽 항목 우선)
+    _CATEGORY_KEYWORDS = (
+        ("disputes", "disputes"),
+        ("분쟁", "disputes"),
+        ("materials", "materials"),
+        ("보도", "materials"),
+    )
+
+    @classmethod
+    def _default_category(cls, filepath: str) -> str:
         """기본 카테고리 감지 (경로 기반)"""
         path_lower = filepath.lower()
-        if "disputes" in path_lower or "분쟁" in path_lower:
-            return "disputes"
-        elif "materials" in path_lower or "보도" in path_lower:
-            return "materials"
-        else:
-            return "unknown"
+        for keyword, category in cls._CATEGORY_KEYWORDS:
+            if keyword in path_lower:
+                return category
+        return "unknown"
 
     def result_to_training_data(
         self,
@@ -59,19 +108,33 @@ class YAMLExporter:
 
         Args:
             result: 추출 결과
-            external_metadata: 외부 메타데이터 (크롤링 데이터)
+            external_metadata: 외부 메타데이터 (크롤링 데이터, 기본: result.external)
 
         Returns:
             TrainingData 또는 None (실패 시)
         """
+        stem = os.path.splitext(os.path.basename(result.filepath))[0]
+        return self._to_training_data(result, external_metadata, stem)
+
+    def _to_training_data(
+        self,
+        result: ExtractResult,
+        external_metadata: dict | None,
+        stem: str,
+    ) -> TrainingData | None:
+        """TrainingData 변환 (stem: 확장자 제외 파일명, 호출측에서 1회 계산)"""
         if not result.success or not result.text:
             return None
 
+        # 외부 메타데이터 미지정 시 배치 처리에서 연결된 값 사용
+        if external_metadata is None:
+            external_metadata = result.external or None
+
         # 카테고리 감지
         category = self.category_detector(result.filepath)
 
         # 제목 추출 (우선순위: 외부 메타데이터 > 파일명 > 본문 첫 줄)
-        title = self._extract_title(result, external_metadata)
+        title = self._extract_title(result, external_metadata, stem)
 
         # 메타데이터 병합
         metadata = self._merge_metadata(result, external_metadata)
@@ -88,6 +151,7 @@ class YAMLExporter:
         self,
         result: ExtractResult,
         external_metadata: dict | None,
+        stem: str,
     ) -> str:
         """제목 추출"""
         # 1. 외부 메타데이터에서 제목
@@ -95,11 +159,8 @@ class YAMLExporter:
             return external_metadata["title"]
 
         # 2. 파일명에서 추출
-        filename = os.path.basename(result.filepath)
-        name_without_ext = os.path.splitext(filename)[0]
-
         # 괄호 제거, 언더스코어 공백 변환
-        title = name_without_ext.replace("_", " ").strip()
+        title = stem.replace("_", " ").strip()
 
         # 너무 짧으면 본문 첫 줄 사용
         if len(title) < 5 and result.text:
@@ -129,7 +190,7 @@ class YAMLExporter:
         metadata["extraction"] = {
             "method": result.method,
             "char_count": result.char_count,
-            "extracted_at": result.extracted_at.isoformat(),
+            "extracted_at": result.extracted_at_iso,
         }
 
         # 외부 메타데이터 (크롤링)
@@ -152,59 +213,88 @@ class YAMLExporter:
         Returns:
             저장된 파일 경로 또는 None
         """
-        training_data = self.result_to_training_data(result, external_metadata)
+        # 파일명 생성 (원본 파일명 기반)
+        base_name = os.path.splitext(os.path.basename(result.filepath))[0]
+
+        training_data = self._to_training_data(result, external_metadata, base_name)
         if not training_data:
             return None
 
-        # 파일명 생성 (원본 파일명 기반)
-        base_name = Path(result.filepath).stem
         output_path = self.output_dir / f"{base_name}.yaml"
 
         with open(output_path, "w", encoding="utf-8") as f:
-            yaml.dump(
-                training_data.to_dict(),
-                f,
-                allow_unicode=True,
-                default_flow_style=False,
-                sort_keys=False,
-            )
+            self._dump(training_data.to_dict(), f)
 
         return str(output_path)
 
     def export_batch(
         self,
-        batch_result: BatchResult,
+        batch_result: BatchResult | Iterable[ExtractResult],
         metadata_getter: Callable[[str], dict] | None = None,
+        workers: int | None = None,
     ) -> list[str]:
         """
         배치 결과 YAML 저장
 
+        파일별 직렬화/쓰기는 서로 독립적이므로 스레드 풀에서 병렬 처리
+
         Args:
-            batch_result: 배치 처리 결과
-            metadata_getter: 파일 경로 → 외부 메타데이터 함수
+            batch_result: 배치 처리 결과 (또는 ExtractResult 이터러블)
+            metadata_getter: 파일 경로 → 외부 메타데이터 함수 (미지정 시 result.external)
+            workers: 스레드 수 (기본: CPU 코어 × 4, 최대 32)
 
         Returns:
-            저장된 파일 경로 목록
+            저장된 파일 경로 목록 (출력 경로가 같은 결과는 마지막 결과로 저장, 경로는 1회만 포함)
         """
-        saved_paths = []
+        if workers is None:
+            workers = min(32, (os.cpu_count() or 1) * 4)
 
-        for result in batch_result.results:
-            if not result.success:
-                continue
+        export_single = self.export_single
 
+        def export_one(result: ExtractResult) -> str | None:
             external_meta = None
             if metadata_getter:
                 external_meta = metadata_getter(result.filepath)
-
-            path = self.export_single(result, external_meta)
+            return export_single(result, external_meta)
+
+        # 텍스트 없는 결과는 변환 전에 제외
+        successes = (r for r in _iter_results(batch_result) if r.success and r.text)
+
+        # 진행 중인 작업은 스레드 수의 2배로 제한 (map은 입력 전체를 먼저 제출)
+        limit = workers * 2
+        pending: deque = deque()
+        writing: dict[str, Future] = {}
+        saved: dict[str, None] = {}
+
+        def collect() -> None:
+            base_name, future = pending.popleft()
+            path = future.result()
+            if writing.get(base_name) is future:
+                del writing[base_name]
             if path:
-                saved_paths.append(path)
-
-        return saved_paths
+                saved[path] = None
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for result in successes:
+                base_name = os.path.splitext(os.path.basename(result.filepath))[0]
+                # 출력 경로가 같으면 앞선 쓰기 완료 후 제출 (동시 쓰기 방지, 마지막 결과 유지)
+                previous = writing.get(base_name)
+                if previous is not None:
+                    previous.result()
+
+                future = executor.submit(export_one, result)
+                writing[base_name] = future
+                pending.append((base_name, future))
+                if len(pending) >= limit:
+                    collect()
+            while pending:
+                collect()
+
+        return list(saved)
 
     def export_batch_jsonl(
         self,
-        batch_result: BatchResult,
+        batch_result: BatchResult | Iterable[ExtractResult],
         output_file: str,
         metadata_getter: Callable[[str], dict] | None = None,
     ) -> int:
@@ -212,42 +302,43 @@ class YAMLExporter:
         배치 결과 JSONL 저장 (대용량 처리용)
 
         Args:
-            batch_result: 배치 처리 결과
+            batch_result: 배치 처리 결과 (또는 ExtractResult 이터러블)
             output_file: 출력 파일 경로
-            metadata_getter: 파일 경로 → 외부 메타데이터 함수
+            metadata_getter: 파일 경로 → 외부 메타데이터 함수 (미지정 시 result.external)
 
         Returns:
             저장된 레코드 수
         """
         count = 0
+        to_training_data = self.result_to_training_data
 
-        with open(output_file, "w", encoding="utf-8") as f:
-            for result in batch_result.results:
-                if not result.success:
-                    continue
+        # 텍스트 없는 결과는 변환 전에 제외
+        successes = (r for r in _iter_results(batch_result) if r.success and r.text)
 
+        with open(output_file, "wb", buffering=_JSONL_BUFFER_SIZE) as f:
+            for result in successes:
                 external_meta = None
                 if metadata_getter:
                     external_meta = metadata_getter(result.filepath)
 
-                training_data = self.result_to_training_data(result, external_meta)
+                training_data = to_training_data(result, external_meta)
                 if training_data:
-                    f.write(json.dumps(training_data.to_dict(), ensure_ascii=False))
-                    f.write("\n")
+                    f.write(_dumps_json(training_data.to_dict()))
+                    f.write(b"\n")
                     count += 1
 
         return count
 
     def export_failed_log(
         self,
-        batch_result: BatchResult,
+        batch_result: BatchResult | Iterable[ExtractResult],
         output_file: str,
     ) -> int:
         """
         실패 로그 JSONL 저장
 
         Args:
-            batch_result: 배치 처리 결과
+            batch_result: 배치 처리 결과 (또는 ExtractResult 이터러블)
             output_file: 출력 파일 경로
 
         Returns:
@@ -255,19 +346,18 @@ class YAMLExporter:
         """
         count = 0
 
-        with open(output_file, "w", encoding="utf-8") as f:
-            for result in batch_result.results:
-                if result.success:
-                    continue
+        failures = (r for r in _iter_results(batch_result) if not r.success)
 
+        with open(output_file, "wb", buffering=_JSONL_BUFFER_SIZE) as f:
+            for result in failures:
                 log_entry = {
                     "filepath": result.filepath,
                     "error": result.error,
                     "method": result.method,
-                    "timestamp": result.extracted_at.isoformat(),
+                    "timestamp": result.extracted_at_iso,
                 }
-                f.write(json.dumps(log_entry, ensure_ascii=False))
-                f.write("\n")
+                f.write(_dumps_json(log_entry))
+                f.write(b"\n")
                 count += 1
 
         return count
@@ -6,6 +6,7 @@ from typing import Literal
 from .constants import STREAM_PRV_TEXT, DEFAULT_ENCODING
 from .reader import HWPReader, HWPReaderError
 from .record import RecordParser
+from .structure import extract_hwp5_structure
 from .models import ExtractResult, StructuredResult
 from .utils import (
     is_hwpx,
@@ -95,6 +96,11 @@ class TextExtractor:
         if not data:
             return None
 
+        # 끝부분 널 패딩은 디코딩 전에 제거 (UTF-16 문자 경계인 짝수 길이로 자름)
+        keep = len(data.rstrip(b"\x00"))
+        keep += keep & 1
+        data = data[:keep]
+
         # UTF-16LE 디코딩
         try:
             text = data.decode(DEFAULT_ENCODING, errors="replace")
@@ -250,8 +256,6 @@ def extract_hwp_structure(filepath: str) -> StructuredResult:
             )
 
     # HWP 5.x (OLE2 기반) 처리
-    from .structure import extract_hwp5_structure
-
     try:
         with HWPReader(filepath) as reader:
             sections = list(reader.iter_sections())
@@ -7,47 +7,166 @@ LibreOffice로 PDF 변환 후 Docling으로 구조 추출.
     HWP 3.x → LibreOffice → PDF → Docling → 구조화된 출력 → YAML
 """
 
+import gzip
 import os
 import re
+import shutil
 import tempfile
 import subprocess
-import shutil
+import weakref
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
+from itertools import repeat
+from multiprocessing import cpu_count
+from multiprocessing.util import Finalize
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 
+from .constants import PROGRESS_MININTERVAL
 from .triage import detect_hwp_version, HWPVersion
 
+# PyYAML (모듈 로드 시 1회 import, libyaml C 이미터 우선)
+try:
+    import yaml
+    try:
+        from yaml import CSafeDumper as _YAMLDumper
+    except ImportError:
+        from yaml import SafeDumper as _YAMLDumper
+except ImportError:
+    yaml = None
+
+# LibreOffice 1회 실행으로 변환할 최대 파일 수 (파일당 1~2초 기동 비용 분산)
+_PDF_BATCH_SIZE = 50
+
+# 파일당 LibreOffice 변환 제한 시간 (초)
+_PDF_TIMEOUT_SECONDS = 120
+
+# 묶음 변환 전체 제한 시간 (초, 멈춘 문서 하나가 워커를 오래 붙잡지 않도록 상한)
+_PDF_BATCH_TIMEOUT_SECONDS = _PDF_TIMEOUT_SECONDS * 5
+
+
+def _dump_yaml(data: Any, stream=None):
+    """YAML 직렬화 (stream이 None이면 문자열 반환)"""
+    if yaml is None:
+        raise ImportError("PyYAML 설치 필요: pip install pyyaml")
+    return yaml.dump(
+        data,
+        stream,
+        Dumper=_YAMLDumper,
+        allow_unicode=True,
+        default_flow_style=False,
+        sort_keys=False,
+    )
+
+
+def _write_yaml_file(path: str, data: Dict[str, Any], raw_text_sidecar: bool = False) -> None:
+    """
+    YAML 파일 저장
+
+    raw_text_sidecar이면 원문(raw_text)은 YAML에서 빼고
+    같은 이름의 .txt.gz 파일로 압축 저장
+    """
+    if raw_text_sidecar and "raw_text" in data:
+        raw_text = data["raw_text"]
+        data = {key: value for key, value in data.items() if key != "raw_text"}
+        sidecar_path = os.path.splitext(path)[0] + ".txt.gz"
+        with open(sidecar_path, "wb") as f:
+            f.write(gzip.compress(raw_text.encode("utf-8"), mtime=0))
+
+    with open(path, "w", encoding="utf-8") as f:
+        _dump_yaml(data, f)
+
+
+def _snapshot_pdfs(directory: str) -> Dict[str, int]:
+    """디렉토리 내 PDF 파일명 → 수정 시각(ns)"""
+    try:
+        with os.scandir(directory) as entries:
+            return {
+                entry.name: entry.stat().st_mtime_ns
+                for entry in entries
+                if entry.name.endswith(".pdf")
+            }
+    except OSError:
+        return {}
+
+
+def _find_libreoffice(libreoffice_path: str) -> str:
+    """LibreOffice 실행 파일 절대 경로 (없으면 RuntimeError)"""
+    resolved = shutil.which(libreoffice_path)
+    if resolved is None:
+        raise RuntimeError(
+            f"LibreOffice를 찾을 수 없습니다: {libreoffice_path}\n"
+            "설치: sudo apt install libreoffice"
+        )
+    return resolved
+
+
+def _mtime_ns(path: str) -> Optional[int]:
+    """파일 수정 시각(ns) (없으면 None)"""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+@lru_cache(maxsize=1)
+def _docling_installed() -> bool:
+    """Docling 설치 여부 (import 시도는 프로세스당 1회)"""
+    try:
+        from docling.document_converter import DocumentConverter
+        return True
+    except ImportError:
+        return False
+
+
+@lru_cache(maxsize=1)
+def _get_docling_converter():
+    """
+    Docling DocumentConverter (프로세스당 1개)
+
+    생성 시 레이아웃/OCR 모델을 로드하므로 파일마다 새로 만들지 않음
+    """
+    from docling.document_converter import DocumentConverter
+    return DocumentConverter()
+
+
+# 분쟁조정 문서 섹션 패턴 (호출마다 컴파일하지 않도록 모듈 로드 시 1회)
+_SECTION_PATTERNS = [
+    (key, re.compile(pattern, re.DOTALL | re.IGNORECASE))
+    for key, pattern in (
+        ("parties", r"(?:당\s*사\s*자|당사자)(.*?)(?=신청취지|이\s*유|$)"),
+        ("request", r"(?:신청취지|신청\s*취지)(.*?)(?=이\s*유|사실관계|$)"),
+        ("facts", r"(?:사실관계|사실\s*관계)(.*?)(?=신청인의\s*주장|신청인\s*주장|$)"),
+        ("applicant_claim", r"(?:신청인의?\s*주장)(.*?)(?=피신청인의?\s*주장|$)"),
+        ("respondent_claim", r"(?:피신청인의?\s*주장)(.*?)(?=위원회의?\s*판단|판단|$)"),
+        ("decision", r"(?:위원회의?\s*판단|판\s*단)(.*?)$"),
+    )
+]
+_HEADING_RE = re.compile(r"^#+\s*", re.MULTILINE)
+_WS_RE = re.compile(r"\s+")
+
 
 def _parse_dispute_structure(text: str, filepath: str) -> Dict[str, Any]:
     """분쟁조정 문서 구조 파싱"""
     case_id = Path(filepath).stem
 
-    sections = {
-        "parties": r"(?:당\s*사\s*자|당사자)(.*?)(?=신청취지|이\s*유|$)",
-        "request": r"(?:신청취지|신청\s*취지)(.*?)(?=이\s*유|사실관계|$)",
-        "facts": r"(?:사실관계|사실\s*관계)(.*?)(?=신청인의\s*주장|신청인\s*주장|$)",
-        "applicant_claim": r"(?:신청인의?\s*주장)(.*?)(?=피신청인의?\s*주장|$)",
-        "respondent_claim": r"(?:피신청인의?\s*주장)(.*?)(?=위원회의?\s*판단|판단|$)",
-        "decision": r"(?:위원회의?\s*판단|판\s*단)(.*?)$",
-    }
-
     result = {"case_id": case_id}
 
-    for key, pattern in sections.items():
-        match = re.search(pattern, text, re.DOTALL | re.IGNORECASE)
+    for key, pattern in _SECTION_PATTERNS:
+        match = pattern.search(text)
         if match:
             content = match.group(1).strip()
-            content = re.sub(r"^#+\s*", "", content, flags=re.MULTILINE)
-            content = re.sub(r"\s+", " ", content).strip()
+            content = _HEADING_RE.sub("", content)
+            content = _WS_RE.sub(" ", content).strip()
             if content:
                 result[key] = content
 
     return result
 
 
-@dataclass
+@dataclass(slots=True)
 class ConversionResult:
     """HWP 3.x 변환 결과"""
     filepath: str
@@ -59,8 +178,18 @@ class ConversionResult:
     error: Optional[str] = None
     pdf_path: Optional[str] = None
 
-    def to_yaml_dict(self) -> Dict[str, Any]:
-        """YAML 출력용 딕셔너리 변환"""
+    def to_yaml_dict(
+        self,
+        include_raw_text: bool = True,
+        converted_at: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        YAML 출력용 딕셔너리 변환
+
+        Args:
+            include_raw_text: 원문 전체(raw_text) 포함 여부
+            converted_at: 변환 시각 ISO 문자열 (None이면 현재 시각, 배치는 1회 계산 후 공유)
+        """
         if not self.success or not self.text:
             return {
                 "metadata": {
@@ -74,14 +203,14 @@ class ConversionResult:
 
         parsed = _parse_dispute_structure(self.text, self.filepath)
 
-        return {
+        yaml_dict = {
             "metadata": {
                 "case_id": parsed.get("case_id", ""),
                 "source": "fss_disputes",
                 "source_file": self.filepath,
                 "version": "hwp3",
                 "method": self.method,
-                "converted_at": datetime.now().isoformat(),
+                "converted_at": converted_at or datetime.now().isoformat(),
             },
             "content": {
                 "parties": parsed.get("parties"),
@@ -92,21 +221,14 @@ class ConversionResult:
                 "decision": parsed.get("decision"),
             },
             "tables": self.tables,
-            "raw_text": self.text,
         }
+        if include_raw_text:
+            yaml_dict["raw_text"] = self.text
+        return yaml_dict
 
     def to_yaml(self) -> str:
         """YAML 문자열 변환"""
-        try:
-            import yaml
-            return yaml.dump(
-                self.to_yaml_dict(),
-                allow_unicode=True,
-                default_flow_style=False,
-                sort_keys=False,
-            )
-        except ImportError:
-            raise ImportError("PyYAML 설치 필요: pip install pyyaml")
+        return _dump_yaml(self.to_yaml_dict())
 
 
 class HWP3Converter:
@@ -115,6 +237,9 @@ class HWP3Converter:
 
     LibreOffice를 사용하여 PDF로 변환 후
     Docling으로 구조화된 텍스트 추출
+
+    임시 PDF 디렉토리는 인스턴스당 하나를 재사용하므로
+    사용 후 close() 호출 또는 with 문 사용 권장 (호출하지 않아도 GC 시 삭제).
     """
 
     def __init__(
@@ -122,16 +247,22 @@ class HWP3Converter:
         libreoffice_path: str = "libreoffice",
         keep_pdf: bool = False,
         pdf_output_dir: Optional[str] = None,
+        profile_dir: Optional[str] = None,
     ):
         """
         Args:
             libreoffice_path: LibreOffice 실행 경로
             keep_pdf: 변환된 PDF 유지 여부
             pdf_output_dir: PDF 저장 디렉토리 (None이면 임시 디렉토리)
+            profile_dir: LibreOffice 사용자 프로필 디렉토리
+                (None이면 기본 프로필, 동시 실행 시 인스턴스별로 분리 필요)
         """
         self.libreoffice_path = libreoffice_path
         self.keep_pdf = keep_pdf
         self.pdf_output_dir = pdf_output_dir
+        self.profile_dir = profile_dir
+        self._tmpdir: Optional[str] = None
+        self._tmpdir_finalizer: Optional[weakref.finalize] = None
 
         # LibreOffice 확인
         self._check_libreoffice()
@@ -139,37 +270,39 @@ class HWP3Converter:
         # Docling 확인
         self._docling_available = self._check_docling()
 
+    def close(self) -> None:
+        """재사용 임시 PDF 디렉토리 삭제"""
+        if self._tmpdir is not None:
+            self._tmpdir_finalizer()
+            self._tmpdir = None
+            self._tmpdir_finalizer = None
+
+    def __enter__(self) -> "HWP3Converter":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
     def _check_libreoffice(self) -> None:
-        """LibreOffice 설치 확인"""
-        try:
-            result = subprocess.run(
-                [self.libreoffice_path, "--version"],
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-            if result.returncode != 0:
-                raise RuntimeError("LibreOffice 실행 실패")
-        except FileNotFoundError:
-            raise RuntimeError(
-                f"LibreOffice를 찾을 수 없습니다: {self.libreoffice_path}\n"
-                "설치: sudo apt install libreoffice"
-            )
+        """
+        LibreOffice 설치 확인
+
+        --version 실행(프로세스 기동) 대신 PATH 검색만 하고,
+        찾은 절대 경로를 변환 실행에 재사용
+        """
+        self._libreoffice_bin = _find_libreoffice(self.libreoffice_path)
 
     def _check_docling(self) -> bool:
-        """Docling 설치 확인"""
-        try:
-            from docling.document_converter import DocumentConverter
-            return True
-        except ImportError:
-            return False
+        """Docling 설치 확인 (프로세스당 1회)"""
+        return _docling_installed()
 
-    def convert(self, filepath: str) -> ConversionResult:
+    def convert(self, filepath: str, verify_version: bool = True) -> ConversionResult:
         """
         HWP 3.x 파일을 변환
 
         Args:
             filepath: HWP 3.x 파일 경로
+            verify_version: 버전 확인 여부 (트리아지로 이미 확인했으면 False)
 
         Returns:
             ConversionResult
@@ -177,6 +310,69 @@ class HWP3Converter:
         filepath = str(filepath)
 
         # 버전 확인
+        if verify_version:
+            not_hwp3 = self._check_version(filepath)
+            if not_hwp3:
+                return not_hwp3
+
+        return self._convert_single(filepath)
+
+    def convert_many(
+        self,
+        filepaths: List[str],
+        verify_version: bool = True,
+    ) -> List[ConversionResult]:
+        """
+        여러 HWP 3.x 파일을 LibreOffice 1회 실행으로 PDF 변환 후 추출
+
+        묶음 변환에서 PDF가 나오지 않은 파일(또는 PDF 이름이 겹치는 파일)은
+        convert()와 같은 개별 변환으로 처리
+
+        Args:
+            filepaths: HWP 3.x 파일 경로 목록
+            verify_version: 버전 확인 여부 (트리아지로 이미 확인했으면 False)
+
+        Returns:
+            ConversionResult 목록 (입력 순서)
+        """
+        filepaths = [str(fp) for fp in filepaths]
+        if verify_version:
+            results: List[Optional[ConversionResult]] = [
+                self._check_version(fp) for fp in filepaths
+            ]
+        else:
+            results = [None] * len(filepaths)
+
+        # 같은 이름의 PDF가 덮어써지지 않도록 이름이 겹치지 않는 파일만 묶음 변환
+        batch = []
+        names = set()
+        for filepath, result in zip(filepaths, results):
+            name = os.path.splitext(os.path.basename(filepath))[0]
+            if result is None and name not in names:
+                names.add(name)
+                batch.append(filepath)
+
+        pdf_paths = self._convert_many_to_pdf(batch) if batch else {}
+
+        # 묶음 변환된 PDF를 먼저 추출 (개별 변환이 같은 이름의 PDF를 덮어쓰기 전에)
+        extract_indices = [
+            i for i, filepath in enumerate(filepaths)
+            if results[i] is None and filepath in pdf_paths
+        ]
+        extracted = self._extract_many(
+            [(filepaths[i], pdf_paths[filepaths[i]]) for i in extract_indices]
+        )
+        for i, result in zip(extract_indices, extracted):
+            results[i] = result
+
+        for i, filepath in enumerate(filepaths):
+            if results[i] is None:
+                results[i] = self._convert_single(filepath)
+
+        return results
+
+    def _check_version(self, filepath: str) -> Optional[ConversionResult]:
+        """HWP 3.x가 아니면 실패 결과 반환 (HWP 3.x면 None)"""
         version = detect_hwp_version(filepath)
         if version != HWPVersion.HWP_3X:
             return ConversionResult(
@@ -184,8 +380,10 @@ class HWP3Converter:
                 success=False,
                 error=f"HWP 3.x가 아님: {version.value}",
             )
+        return None
 
-        # PDF 변환
+    def _convert_single(self, filepath: str) -> ConversionResult:
+        """단일 파일 PDF 변환 후 추출"""
         try:
             pdf_path = self._convert_to_pdf(filepath)
         except Exception as e:
@@ -195,61 +393,200 @@ class HWP3Converter:
                 error=f"PDF 변환 실패: {e}",
             )
 
+        return self._extract(filepath, pdf_path)
+
+    def _extract(self, filepath: str, pdf_path: str) -> ConversionResult:
+        """PDF에서 추출 (Docling 우선, 실패/미설치 시 pdftotext)"""
         # Docling으로 추출
         if self._docling_available:
             try:
                 result = self._extract_with_docling(filepath, pdf_path)
-                return result
             except Exception as e:
                 # Docling 실패 시 pdftotext 폴백
-                return self._extract_with_pdftotext(filepath, pdf_path)
+                result = self._extract_with_pdftotext(filepath, pdf_path)
         else:
             # Docling 없으면 pdftotext 사용
-            return self._extract_with_pdftotext(filepath, pdf_path)
+            result = self._extract_with_pdftotext(filepath, pdf_path)
 
-    def _convert_to_pdf(self, filepath: str) -> str:
-        """LibreOffice로 PDF 변환"""
+        # 추출 실패 시에도 PDF 정리 (재사용 임시 디렉토리에 이전 PDF가 남지 않도록)
+        if not self.keep_pdf:
+            self._cleanup_pdf(pdf_path)
+        return result
+
+    def _extract_many(self, items: List[Tuple[str, str]]) -> List[ConversionResult]:
+        """
+        여러 PDF에서 추출
+
+        Docling은 convert_all로 한 번에 넘겨 문서 간 배치 처리를 활용.
+        Docling이 실패한 문서는 pdftotext 폴백, 결과가 오지 않은 문서는 _extract()로 개별 처리.
+
+        Args:
+            items: (원본 경로, PDF 경로) 목록
+
+        Returns:
+            ConversionResult 목록 (입력 순서)
+        """
+        if not self._docling_available or len(items) < 2:
+            return [self._extract(filepath, pdf_path) for filepath, pdf_path in items]
+
+        results: List[Optional[ConversionResult]] = [None] * len(items)
+        try:
+            from docling.datamodel.base_models import ConversionStatus
+
+            converted = (ConversionStatus.SUCCESS, ConversionStatus.PARTIAL_SUCCESS)
+            index = {os.path.realpath(pdf_path): i for i, (_, pdf_path) in enumerate(items)}
+            conv_results = _get_docling_converter().convert_all(
+                [pdf_path for _, pdf_path in items],
+                raises_on_error=False,
+            )
+            for conv_result in conv_results:
+                i = index.pop(os.path.realpath(conv_result.input.file), None)
+                if i is None:
+                    continue
+                filepath, pdf_path = items[i]
+
+                result = None
+                if conv_result.status in converted:
+                    try:
+                        result = self._docling_result(filepath, pdf_path, conv_result.document)
+                    except Exception:
+                        pass
+                if result is None:
+                    # Docling 실패 시 pdftotext 폴백
+                    result = self._extract_with_pdftotext(filepath, pdf_path)
+
+                if not self.keep_pdf:
+                    self._cleanup_pdf(pdf_path)
+                results[i] = result
+        except Exception:
+            # 남은 문서는 아래에서 개별 추출
+            pass
+
+        return [
+            result if result is not None else self._extract(filepath, pdf_path)
+            for result, (filepath, pdf_path) in zip(results, items)
+        ]
+
+    def _soffice_command(self) -> List[str]:
+        """LibreOffice headless 실행 인자 (프로필 지정 시 포함)"""
+        command = [self._libreoffice_bin, "--headless"]
+        if self.profile_dir:
+            # LibreOffice는 프로필을 잠그므로 동시 실행 인스턴스는 프로필을 분리해야 함
+            command.append(f"-env:UserInstallation={Path(self.profile_dir).resolve().as_uri()}")
+        return command
+
+    def _make_output_dir(self) -> str:
+        """
+        PDF 출력 디렉토리 준비
+
+        지정 없으면 인스턴스 임시 디렉토리를 재사용 (파일마다 mkdir/rmdir 없음).
+        단, keep_pdf이면 보존된 PDF가 덮어써지지 않도록 호출마다 새 임시 디렉토리.
+        """
         if self.pdf_output_dir:
-            output_dir = self.pdf_output_dir
-            os.makedirs(output_dir, exist_ok=True)
+            os.makedirs(self.pdf_output_dir, exist_ok=True)
+            return self.pdf_output_dir
+        if self.keep_pdf:
+            return tempfile.mkdtemp(prefix="hwp3_")
+        if self._tmpdir is None:
+            self._tmpdir = tempfile.mkdtemp(prefix="hwp3_")
+            # close() 없이 버려진 인스턴스도 GC/인터프리터 종료 시 삭제
+            self._tmpdir_finalizer = weakref.finalize(
+                self, shutil.rmtree, self._tmpdir, True
+            )
+        return self._tmpdir
+
+    def _convert_many_to_pdf(self, filepaths: List[str]) -> Dict[str, str]:
+        """
+        LibreOffice 1회 실행으로 여러 파일을 PDF 변환
+
+        LibreOffice는 인자로 받은 파일을 순서대로 변환하므로
+        기동 비용은 한 번만 발생. 파일별 성공 여부는 이번 실행에서
+        생성(또는 갱신)된 PDF 존재로 판단.
+
+        Returns:
+            {원본 경로: PDF 경로} (이번 실행에서 PDF가 생성된 파일만)
+        """
+        output_dir = self._make_output_dir()
+
+        # 실행 전 목록 (이전 실행에서 남은 같은 이름의 PDF를 성공으로 보지 않도록)
+        before = _snapshot_pdfs(output_dir)
+
+        timed_out = False
+        try:
+            result = subprocess.run(
+                [
+                    *self._soffice_command(),
+                    "--convert-to", "pdf",
+                    "--outdir", output_dir,
+                    *filepaths,
+                ],
+                capture_output=True,
+                text=True,
+                timeout=min(_PDF_TIMEOUT_SECONDS * len(filepaths), _PDF_BATCH_TIMEOUT_SECONDS),
+            )
+        except subprocess.TimeoutExpired:
+            timed_out = True
+        except OSError:
+            return {}
         else:
-            output_dir = tempfile.mkdtemp(prefix="hwp3_")
+            if result.returncode != 0:
+                # 비정상 종료: 전체를 호출측에서 개별 변환
+                return {}
+
+        after = _snapshot_pdfs(output_dir)
+
+        pdf_paths = {}
+        for filepath in filepaths:
+            pdf_name = os.path.splitext(os.path.basename(filepath))[0] + ".pdf"
+            mtime = after.get(pdf_name)
+            if mtime is not None and before.get(pdf_name) != mtime:
+                pdf_paths[filepath] = os.path.join(output_dir, pdf_name)
+
+        if timed_out and pdf_paths:
+            # 시간 초과 시 마지막 PDF는 작성 중이었을 수 있으므로 개별 변환으로 넘김
+            pdf_paths.pop(next(reversed(pdf_paths)))
+        return pdf_paths
+
+    def _convert_to_pdf(self, filepath: str) -> str:
+        """LibreOffice로 PDF 변환"""
+        output_dir = self._make_output_dir()
+        basename = os.path.splitext(os.path.basename(filepath))[0]
+        pdf_path = os.path.join(output_dir, f"{basename}.pdf")
+        before = _mtime_ns(pdf_path)
 
         # LibreOffice 변환 실행
         result = subprocess.run(
             [
-                self.libreoffice_path,
-                "--headless",
+                *self._soffice_command(),
                 "--convert-to", "pdf",
                 "--outdir", output_dir,
                 filepath,
             ],
             capture_output=True,
             text=True,
-            timeout=120,
+            timeout=_PDF_TIMEOUT_SECONDS,
         )
 
         if result.returncode != 0:
             raise RuntimeError(f"LibreOffice 오류: {result.stderr}")
 
-        # PDF 파일 경로 찾기
-        basename = os.path.splitext(os.path.basename(filepath))[0]
-        pdf_path = os.path.join(output_dir, f"{basename}.pdf")
-
-        if not os.path.exists(pdf_path):
+        # 이전 실행에서 남은 PDF는 생성 실패로 처리
+        after = _mtime_ns(pdf_path)
+        if after is None or after == before:
             raise RuntimeError(f"PDF 파일 생성 실패: {pdf_path}")
 
         return pdf_path
 
     def _extract_with_docling(self, filepath: str, pdf_path: str) -> ConversionResult:
         """Docling으로 구조 추출 (YAML 직접 변환)"""
-        from docling.document_converter import DocumentConverter
-
-        converter = DocumentConverter()
+        converter = _get_docling_converter()
         result = converter.convert(pdf_path)
+        return self._docling_result(filepath, pdf_path, result.document)
 
+    def _docling_result(self, filepath: str, pdf_path: str, document) -> ConversionResult:
+        """Docling 문서에서 텍스트/테이블 추출"""
         # 구조화된 딕셔너리 추출 (마크다운 중간 단계 없음)
-        doc_dict = result.document.export_to_dict()
+        doc_dict = document.export_to_dict()
 
         # 텍스트 추출 (구조 보존)
         texts = []
@@ -263,7 +600,7 @@ class HWP3Converter:
 
         # 테이블 추출 (구조 보존)
         tables = []
-        for i, table in enumerate(result.document.tables):
+        for i, table in enumerate(document.tables):
             table_data = {
                 "table_id": f"table_{i}",
                 "rows": table.num_rows,
@@ -271,21 +608,15 @@ class HWP3Converter:
                 "cells": [],
             }
             try:
-                for row_idx, row in enumerate(table.data):
-                    for col_idx, cell in enumerate(row):
-                        table_data["cells"].append({
-                            "row": row_idx,
-                            "col": col_idx,
-                            "text": str(cell) if cell else "",
-                        })
+                table_data["cells"] = [
+                    {"row": row_idx, "col": col_idx, "text": str(cell) if cell else ""}
+                    for row_idx, row in enumerate(table.data)
+                    for col_idx, cell in enumerate(row)
+                ]
             except Exception:
                 pass
             tables.append(table_data)
 
-        # PDF 정리
-        if not self.keep_pdf:
-            self._cleanup_pdf(pdf_path)
-
         return ConversionResult(
             filepath=filepath,
             success=True,
@@ -299,17 +630,18 @@ class HWP3Converter:
     def _extract_with_pdftotext(self, filepath: str, pdf_path: str) -> ConversionResult:
         """pdftotext로 텍스트 추출 (Docling 폴백)"""
         try:
+            # text 모드(로케일 인코딩 + 줄바꿈 변환 계층) 대신 바이트로 받아 UTF-8로 1회 디코딩
             result = subprocess.run(
-                ["pdftotext", "-layout", pdf_path, "-"],
+                ["pdftotext", "-layout", "-enc", "UTF-8", pdf_path, "-"],
                 capture_output=True,
-                text=True,
                 timeout=60,
             )
 
             if result.returncode != 0:
-                raise RuntimeError(f"pdftotext 오류: {result.stderr}")
+                stderr = result.stderr.decode("utf-8", errors="replace")
+                raise RuntimeError(f"pdftotext 오류: {stderr}")
 
-            text = result.stdout.strip()
+            text = result.stdout.decode("utf-8", errors="replace").strip()
 
             # PDF 정리
             if not self.keep_pdf:
@@ -339,15 +671,16 @@ class HWP3Converter:
             )
 
     def _cleanup_pdf(self, pdf_path: str) -> None:
-        """PDF 파일 정리"""
+        """
+        PDF 파일 정리
+
+        디렉토리는 삭제하지 않음 (keep_pdf가 아니면 PDF는 호출측 pdf_output_dir
+        또는 close()에서 삭제되는 재사용 임시 디렉토리에만 생성됨)
+        """
+        # 존재 확인 stat 없이 바로 삭제 (EAFP)
         try:
-            if os.path.exists(pdf_path):
-                os.remove(pdf_path)
-            # 임시 디렉토리 정리
-            parent = os.path.dirname(pdf_path)
-            if parent.startswith(tempfile.gettempdir()) and os.path.isdir(parent):
-                shutil.rmtree(parent, ignore_errors=True)
-        except Exception:
+            os.remove(pdf_path)
+        except OSError:
             pass
 
 
@@ -355,6 +688,7 @@ def convert_hwp3(
     filepath: str,
     keep_pdf: bool = False,
     pdf_output_dir: Optional[str] = None,
+    verify_version: bool = True,
 ) -> ConversionResult:
     """
     HWP 3.x 파일 변환 (편의 함수)
@@ -363,15 +697,65 @@ def convert_hwp3(
         filepath: HWP 3.x 파일 경로
         keep_pdf: 변환된 PDF 유지 여부
         pdf_output_dir: PDF 저장 디렉토리
+        verify_version: 버전 확인 여부
 
     Returns:
         ConversionResult
     """
-    converter = HWP3Converter(
+    with HWP3Converter(
         keep_pdf=keep_pdf,
         pdf_output_dir=pdf_output_dir,
+    ) as converter:
+        return converter.convert(filepath, verify_version=verify_version)
+
+
+# 워커 프로세스별 변환기 (_init_convert_worker에서 생성)
+_worker_converter: Optional[HWP3Converter] = None
+
+
+def _init_convert_worker(
+    keep_pdf: bool,
+    pdf_output_dir: Optional[str],
+    profile_root: str,
+) -> None:
+    """워커 초기화: 프로세스 전용 LibreOffice 프로필로 변환기 1개 생성"""
+    global _worker_converter
+    _worker_converter = HWP3Converter(
+        keep_pdf=keep_pdf,
+        pdf_output_dir=pdf_output_dir,
+        profile_dir=os.path.join(profile_root, str(os.getpid())),
     )
-    return converter.convert(filepath)
+    # 워커 종료 시 임시 PDF 디렉토리 삭제 (multiprocessing 종료 처리에서 호출)
+    Finalize(_worker_converter, _worker_converter.close, exitpriority=10)
+
+
+def _convert_chunk_worker(chunk: List[str], verify_version: bool) -> List[ConversionResult]:
+    """워커: 파일 묶음 변환"""
+    return _worker_converter.convert_many(chunk, verify_version=verify_version)
+
+
+def _split_chunks(filepaths: List[str], size: int) -> List[List[int]]:
+    """
+    파일 인덱스를 묶음으로 분할
+
+    PDF 이름(파일명)이 같은 파일은 같은 묶음에 넣어
+    서로 다른 워커가 같은 출력 경로에 동시에 쓰지 않도록 함
+    """
+    groups: Dict[str, List[int]] = {}
+    for i, filepath in enumerate(filepaths):
+        name = os.path.splitext(os.path.basename(filepath))[0]
+        groups.setdefault(name, []).append(i)
+
+    chunks = []
+    current: List[int] = []
+    for indices in groups.values():
+        current.extend(indices)
+        if len(current) >= size:
+            chunks.append(current)
+            current = []
+    if current:
+        chunks.append(current)
+    return chunks
 
 
 def batch_convert_hwp3(
@@ -379,37 +763,82 @@ def batch_convert_hwp3(
     keep_pdf: bool = False,
     pdf_output_dir: Optional[str] = None,
     progress: bool = True,
+    workers: Optional[int] = None,
+    verify_version: bool = True,
 ) -> List[ConversionResult]:
     """
     HWP 3.x 파일 배치 변환
 
+    LibreOffice는 _PDF_BATCH_SIZE개 단위로 묶어 한 번씩만 실행하고,
+    workers > 1이면 묶음을 워커 프로세스(각자 LibreOffice 프로필 사용)에 분배
+
     Args:
         filepaths: HWP 3.x 파일 경로 목록
         keep_pdf: 변환된 PDF 유지 여부
         pdf_output_dir: PDF 저장 디렉토리
         progress: 진행률 표시
+        workers: 워커 프로세스 수 (기본: CPU 코어의 50%, 1이면 현재 프로세스에서 순차 처리)
+        verify_version: 파일별 버전 확인 여부
+            (triage_files로 HWP 3.x만 골라 넘기는 경우 False로 헤더 재확인 생략)
 
     Returns:
-        ConversionResult 목록
+        ConversionResult 목록 (입력 순서)
     """
-    converter = HWP3Converter(
-        keep_pdf=keep_pdf,
-        pdf_output_dir=pdf_output_dir,
-    )
-
-    results = []
-    iterator = filepaths
+    filepaths = [str(fp) for fp in filepaths]
+    if workers is None:
+        workers = max(1, cpu_count() // 2)
 
+    pbar = None
     if progress:
         try:
             from tqdm import tqdm
-            iterator = tqdm(filepaths, desc="HWP 3.x 변환")
+            pbar = tqdm(
+                total=len(filepaths), desc="HWP 3.x 변환",
+                mininterval=PROGRESS_MININTERVAL,
+            )
         except ImportError:
             pass
 
-    for filepath in iterator:
-        result = converter.convert(filepath)
-        results.append(result)
+    results: List[Optional[ConversionResult]] = [None] * len(filepaths)
+
+    if workers <= 1 or len(filepaths) <= 1:
+        with HWP3Converter(
+            keep_pdf=keep_pdf,
+            pdf_output_dir=pdf_output_dir,
+        ) as converter:
+            for start in range(0, len(filepaths), _PDF_BATCH_SIZE):
+                chunk = filepaths[start:start + _PDF_BATCH_SIZE]
+                results[start:start + len(chunk)] = converter.convert_many(
+                    chunk, verify_version=verify_version
+                )
+                if pbar is not None:
+                    pbar.update(len(chunk))
+    else:
+        # 워커 초기화 실패(BrokenProcessPool) 대신 순차 처리와 같은 오류를 먼저 발생
+        _find_libreoffice("libreoffice")
+
+        # 모든 워커가 일하도록 묶음 크기를 파일 수에 맞춰 축소
+        size = min(_PDF_BATCH_SIZE, -(-len(filepaths) // workers))
+        chunks = _split_chunks(filepaths, size)
+
+        with tempfile.TemporaryDirectory(prefix="hwp3_profiles_") as profile_root:
+            with ProcessPoolExecutor(
+                max_workers=min(workers, len(chunks)),
+                initializer=_init_convert_worker,
+                initargs=(keep_pdf, pdf_output_dir, profile_root),
+            ) as executor:
+                chunk_paths = ([filepaths[i] for i in chunk] for chunk in chunks)
+                mapped = executor.map(
+                    _convert_chunk_worker, chunk_paths, repeat(verify_version)
+                )
+                for chunk, chunk_results in zip(chunks, mapped):
+                    for i, result in zip(chunk, chunk_results):
+                        results[i] = result
+                    if pbar is not None:
+                        pbar.update(len(chunk))
+
+    if pbar is not None:
+        pbar.close()
 
     return results
 
@@ -434,18 +863,8 @@ def convert_to_yaml(
     yaml_dict = result.to_yaml_dict()
 
     if output_path:
-        try:
-            import yaml
-            with open(output_path, "w", encoding="utf-8") as f:
-                yaml.dump(
-                    yaml_dict,
-                    f,
-                    allow_unicode=True,
-                    default_flow_style=False,
-                    sort_keys=False,
-                )
-        except ImportError:
-            raise ImportError("PyYAML 설치 필요: pip install pyyaml")
+        with open(output_path, "w", encoding="utf-8") as f:
+            _dump_yaml(yaml_dict, f)
 
     return yaml_dict
 
@@ -456,6 +875,8 @@ def batch_convert_to_yaml(
     combined_output: Optional[str] = None,
     keep_pdf: bool = False,
     progress: bool = True,
+    combined_raw_text: bool = False,
+    raw_text_sidecar: bool = False,
 ) -> List[Dict[str, Any]]:
     """
     HWP 3.x 파일 배치 YAML 변환
@@ -466,57 +887,57 @@ def batch_convert_to_yaml(
         combined_output: 통합 YAML 파일 경로 (None이면 저장 안 함)
         keep_pdf: 변환된 PDF 유지 여부
         progress: 진행률 표시
+        combined_raw_text: 통합 파일에 원문 전체(raw_text) 포함 여부
+            (반환값에는 항상 포함, 통합 파일은 문서 수만큼 커지므로 기본 제외)
+        raw_text_sidecar: 개별 YAML에서 raw_text를 빼고 <case_id>.txt.gz로 압축 저장
 
     Returns:
         YAML 딕셔너리 목록
     """
-    results = batch_convert_hwp3(filepaths, keep_pdf=keep_pdf, progress=progress)
-    yaml_dicts = []
-
-    for result in results:
-        yaml_dict = result.to_yaml_dict()
-        yaml_dicts.append(yaml_dict)
+    # PyYAML 확인과 출력 디렉토리 생성은 변환 전 1회
+    if (output_dir or combined_output) and yaml is None:
+        raise ImportError("PyYAML 설치 필요: pip install pyyaml")
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
 
-        # 개별 파일 저장
-        if output_dir:
-            os.makedirs(output_dir, exist_ok=True)
+    results = batch_convert_hwp3(filepaths, keep_pdf=keep_pdf, progress=progress)
+    # 변환 시각은 배치당 1회만 계산
+    converted_at = datetime.now().isoformat()
+    yaml_dicts = [result.to_yaml_dict(converted_at=converted_at) for result in results]
+
+    # 개별 파일 저장 (파일별 직렬화/쓰기는 독립적이므로 스레드 풀에서 병렬 처리)
+    if output_dir:
+        # case_id가 같으면 마지막 결과만 남으므로 경로별로 미리 정리 (동시 쓰기 방지)
+        outputs: Dict[str, Dict[str, Any]] = {}
+        for yaml_dict in yaml_dicts:
             case_id = yaml_dict["metadata"].get("case_id", "unknown")
-            output_path = os.path.join(output_dir, f"{case_id}.yaml")
-            try:
-                import yaml
-                with open(output_path, "w", encoding="utf-8") as f:
-                    yaml.dump(
-                        yaml_dict,
-                        f,
-                        allow_unicode=True,
-                        default_flow_style=False,
-                        sort_keys=False,
-                    )
-            except ImportError:
-                raise ImportError("PyYAML 설치 필요: pip install pyyaml")
+            outputs[os.path.join(output_dir, f"{case_id}.yaml")] = yaml_dict
+
+        workers = min(32, (os.cpu_count() or 1) * 4, max(1, len(outputs)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # list()로 소비해야 쓰기 오류가 호출측으로 전달됨
+            list(executor.map(
+                _write_yaml_file,
+                outputs.keys(),
+                outputs.values(),
+                repeat(raw_text_sidecar),
+            ))
 
     # 통합 파일 저장
     if combined_output:
-        try:
-            import yaml
-            combined = {
-                "metadata": {
-                    "source": "fss_disputes",
-                    "total_disputes": len(yaml_dicts),
-                    "converted_at": datetime.now().isoformat(),
-                },
-                "disputes": yaml_dicts,
-            }
-            with open(combined_output, "w", encoding="utf-8") as f:
-                yaml.dump(
-                    combined,
-                    f,
-                    allow_unicode=True,
-                    default_flow_style=False,
-                    sort_keys=False,
-                )
-        except ImportError:
-            raise ImportError("PyYAML 설치 필요: pip install pyyaml")
+        combined = {
+            "metadata": {
+                "source": "fss_disputes",
+                "total_disputes": len(yaml_dicts),
+                "converted_at": converted_at,
+            },
+            "disputes": yaml_dicts if combined_raw_text else [
+                {key: value for key, value in yaml_dict.items() if key != "raw_text"}
+                for yaml_dict in yaml_dicts
+            ],
+        }
+        with open(combined_output, "w", encoding="utf-8") as f:
+            _dump_yaml(combined, f)
 
     return yaml_dicts
 
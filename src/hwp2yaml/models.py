@@ -1,13 +1,26 @@
 """HWP 파서 데이터 모델"""
 
 from dataclasses import dataclass, field
-from typing import Literal
+from typing import Literal, NamedTuple
 from datetime import datetime
 
+from .constants import (
+    HWPTAG_PARA_TEXT, HWPTAG_PARA_HEADER, HWPTAG_PARA_CHAR_SHAPE,
+    HWPTAG_TABLE, HWPTAG_CTRL_HEADER
+)
 
-@dataclass
-class RecordHeader:
-    """HWP 레코드 헤더"""
+# 태그 ID → 이름 (tag_name 호출마다 만들지 않도록 모듈 수준에 둠)
+_TAG_NAMES = {
+    HWPTAG_PARA_TEXT: "PARA_TEXT",
+    HWPTAG_PARA_HEADER: "PARA_HEADER",
+    HWPTAG_PARA_CHAR_SHAPE: "PARA_CHAR_SHAPE",
+    HWPTAG_TABLE: "TABLE",
+    HWPTAG_CTRL_HEADER: "CTRL_HEADER",
+}
+
+
+class RecordHeader(NamedTuple):
+    """HWP 레코드 헤더 (레코드마다 생성되므로 생성 비용이 낮은 NamedTuple)"""
     tag_id: int
     level: int
     size: int
@@ -15,21 +28,10 @@ class RecordHeader:
     @property
     def tag_name(self) -> str:
         """태그 ID를 사람이 읽을 수 있는 이름으로 변환"""
-        from .constants import (
-            HWPTAG_PARA_TEXT, HWPTAG_PARA_HEADER, HWPTAG_PARA_CHAR_SHAPE,
-            HWPTAG_TABLE, HWPTAG_CTRL_HEADER
-        )
-        names = {
-            HWPTAG_PARA_TEXT: "PARA_TEXT",
-            HWPTAG_PARA_HEADER: "PARA_HEADER",
-            HWPTAG_PARA_CHAR_SHAPE: "PARA_CHAR_SHAPE",
-            HWPTAG_TABLE: "TABLE",
-            HWPTAG_CTRL_HEADER: "CTRL_HEADER",
-        }
-        return names.get(self.tag_id, f"TAG_{self.tag_id:04X}")
+        return _TAG_NAMES.get(self.tag_id, f"TAG_{self.tag_id:04X}")
 
 
-@dataclass
+@dataclass(slots=True)
 class HWPVersion:
     """HWP 버전 정보"""
     major: int
@@ -46,7 +48,7 @@ class HWPVersion:
         return self.major == 5
 
 
-@dataclass
+@dataclass(slots=True)
 class HWPMetadata:
     """HWP 문서 메타데이터"""
     filepath: str
@@ -58,7 +60,7 @@ class HWPMetadata:
     streams: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractResult:
     """텍스트 추출 결과"""
     filepath: str
@@ -69,10 +71,14 @@ class ExtractResult:
     metadata: HWPMetadata | None = None
     char_count: int = 0
     extracted_at: datetime = field(default_factory=datetime.now)
+    external: dict = field(default_factory=dict)  # 외부 메타데이터 (크롤링 데이터)
+    # ISO 문자열 (워커에서 1회 생성, 내보내기 시 재사용)
+    extracted_at_iso: str = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
         if self.text:
             self.char_count = len(self.text)
+        self.extracted_at_iso = self.extracted_at.isoformat()
 
 
 @dataclass
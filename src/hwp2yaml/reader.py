@@ -2,6 +2,7 @@
 
 import os
 import zlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Iterator
 
@@ -19,6 +20,14 @@ from .constants import (
 from .models import HWPMetadata, HWPVersion
 
 
+def _decompress_section(data: bytes) -> bytes:
+    """raw deflate 해제 (압축되지 않은 데이터면 그대로 반환)"""
+    try:
+        return zlib.decompress(data, -15)
+    except zlib.error:
+        return data
+
+
 class HWPReaderError(Exception):
     """HWP 읽기 오류"""
     pass
@@ -41,6 +50,8 @@ class HWPReader:
         self._ole: olefile.OleFileIO | None = None
         self._metadata: HWPMetadata | None = None
         self._file_header: bytes | None = None
+        self._flags: int | None = None
+        self._version: HWPVersion | None = None
 
         self._open()
 
@@ -95,12 +106,26 @@ class HWPReader:
         self.close()
 
     def _get_file_header(self) -> bytes:
-        """FileHeader 스트림 읽기 (캐시)"""
+        """FileHeader 스트림 읽기 (캐시, 버전/속성 플래그도 1회만 해석)"""
         if self._file_header is None:
             try:
-                self._file_header = self.open_stream(STREAM_FILE_HEADER)
+                header = self.open_stream(STREAM_FILE_HEADER)
             except Exception:
-                self._file_header = b""
+                header = b""
+            self._file_header = header
+
+            # offset 32: 버전 (4바이트)
+            # major.minor.build.revision (각 1바이트)
+            if len(header) >= 36:
+                self._version = HWPVersion(
+                    major=header[35],
+                    minor=header[34],
+                    build=header[33],
+                    revision=header[32],
+                )
+            # offset 36: 속성 플래그 (4바이트, little-endian)
+            if len(header) >= 40:
+                self._flags = int.from_bytes(header[36:40], "little")
         return self._file_header
 
     def is_valid_hwp(self) -> bool:
@@ -114,42 +139,26 @@ class HWPReader:
 
         # 시그니처 확인
         header = self._get_file_header()
-        return header[:len(HWP_SIGNATURE)] == HWP_SIGNATURE
+        return header.startswith(HWP_SIGNATURE)
 
     def is_encrypted(self) -> bool:
         """암호화 여부 확인"""
-        header = self._get_file_header()
-        if len(header) < 40:
+        self._get_file_header()
+        if self._flags is None:
             return False
-
-        # offset 36: 속성 플래그 (4바이트, little-endian)
-        flags = int.from_bytes(header[36:40], "little")
-        return bool(flags & FLAG_ENCRYPTED)
+        return bool(self._flags & FLAG_ENCRYPTED)
 
     def is_compressed(self) -> bool:
         """압축 여부 확인"""
-        header = self._get_file_header()
-        if len(header) < 40:
+        self._get_file_header()
+        if self._flags is None:
             return True  # 기본값: 압축
-
-        flags = int.from_bytes(header[36:40], "little")
-        return bool(flags & FLAG_COMPRESSED)
+        return bool(self._flags & FLAG_COMPRESSED)
 
     def get_version(self) -> HWPVersion | None:
         """HWP 버전 정보"""
-        header = self._get_file_header()
-        if len(header) < 36:
-            return None
-
-        # offset 32: 버전 (4바이트)
-        # major.minor.build.revision (각 1바이트)
-        version_bytes = header[32:36]
-        return HWPVersion(
-            major=version_bytes[3],
-            minor=version_bytes[2],
-            build=version_bytes[1],
-            revision=version_bytes[0],
-        )
+        self._get_file_header()
+        return self._version
 
     def list_streams(self) -> list[str]:
         """OLE 스트림 목록"""
@@ -207,11 +216,7 @@ class HWPReader:
             return data
 
         # zlib 압축 해제 (-15: raw deflate, no header)
-        try:
-            return zlib.decompress(data, -15)
-        except zlib.error:
-            # 압축되지 않은 데이터일 수 있음
-            return data
+        return _decompress_section(data)
 
     def iter_sections(self) -> Iterator[tuple[str, bytes]]:
         """
@@ -237,6 +242,45 @@ class HWPReader:
 
             section_idx += 1
 
+    def read_sections(self, workers: int = 1) -> list[tuple[str, bytes]]:
+        """
+        BodyText 섹션 전체 읽기 (list(iter_sections())와 동일 결과)
+
+        zlib 해제는 GIL을 놓으므로 workers > 1이면 섹션 해제를 스레드 풀에서 병렬 처리.
+        OLE 스트림 읽기는 파일 핸들을 공유하므로 순차.
+
+        Args:
+            workers: 해제 스레드 수 (기본 1: 순차 처리).
+                배치 처리처럼 이미 파일 단위로 병렬화된 경우에는 1 유지
+
+        Returns:
+            [(섹션 이름, 압축 해제된 데이터), ...]
+        """
+        if not self._ole:
+            return []
+
+        names = []
+        raw = []
+        while True:
+            section_name = f"{STREAM_BODY_TEXT}/Section{len(names)}"
+            if not self.has_stream(section_name):
+                break
+            try:
+                raw.append(self.open_stream(section_name))
+            except HWPReaderError:
+                break
+            names.append(section_name)
+
+        if not self.is_compressed():
+            return list(zip(names, raw))
+
+        if workers > 1 and len(raw) > 1:
+            with ThreadPoolExecutor(max_workers=min(workers, len(raw))) as executor:
+                data = list(executor.map(_decompress_section, raw))
+        else:
+            data = [_decompress_section(section) for section in raw]
+        return list(zip(names, data))
+
     @property
     def metadata(self) -> HWPMetadata | None:
         """문서 메타데이터"""
@@ -1,7 +1,8 @@
 """HWP 레코드 구조 파싱"""
 
-from typing import Iterator
-from dataclasses import dataclass
+import re
+import struct
+from typing import Iterator, NamedTuple
 
 from .constants import (
     HWPTAG_PARA_TEXT,
@@ -12,12 +13,31 @@ from .constants import (
 )
 from .models import RecordHeader
 
+# 레코드 헤더/확장 크기 (4바이트 리틀 엔디안, 슬라이스 없이 버퍼에서 직접 읽음)
+_UINT32_STRUCT = struct.Struct("<I")
 
-@dataclass
-class Record:
-    """HWP 레코드"""
+# NamedTuple 생성 시 Python 수준 __new__를 거치지 않도록 tuple.__new__ 직접 사용
+# (레코드마다 호출되는 parse_header/iter_records 전용)
+_tuple_new = tuple.__new__
+
+# PARA_TEXT 제어 문자 (0x0000-0x001F)
+_CTRL_CHAR_RE = re.compile(r"[\x00-\x1f]")
+
+# 제거/스킵 대상 제어 문자 (탭, 줄바꿈, 단락 구분 제외)
+_DROP_CTRL_CHAR_RE = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+# 제어 문자 코드 → 추가로 건너뛸 글자 수
+# (확장 제어 문자(inline 객체)는 뒤에 8글자 추가 데이터, 그 외는 0)
+_CTRL_SKIP = bytes(
+    8 if code in (0x0001, 0x0002, 0x0003, 0x000B, 0x000C) else 0
+    for code in range(0x20)
+)
+
+
+class Record(NamedTuple):
+    """HWP 레코드 (레코드마다 생성되므로 생성 비용이 낮은 NamedTuple)"""
     header: RecordHeader
-    data: bytes
+    data: bytes | memoryview
 
 
 class RecordParser:
@@ -31,7 +51,7 @@ class RecordParser:
     }
 
     @staticmethod
-    def parse_header(data: bytes, offset: int = 0) -> tuple[RecordHeader, int]:
+    def parse_header(data: bytes | memoryview, offset: int = 0) -> tuple[RecordHeader, int]:
         """
         레코드 헤더 파싱
 
@@ -53,7 +73,7 @@ class RecordParser:
             raise ValueError("데이터 부족: 레코드 헤더 파싱 불가")
 
         # 4바이트 리틀 엔디안
-        header_val = int.from_bytes(data[offset:offset + 4], "little")
+        header_val = _UINT32_STRUCT.unpack_from(data, offset)[0]
 
         tag_id = header_val & 0x3FF           # 하위 10비트
         level = (header_val >> 10) & 0x3FF    # 다음 10비트
@@ -65,42 +85,83 @@ class RecordParser:
         if size == 0xFFF:
             if len(data) < next_offset + 4:
                 raise ValueError("데이터 부족: 확장 크기 파싱 불가")
-            size = int.from_bytes(data[next_offset:next_offset + 4], "little")
+            size = _UINT32_STRUCT.unpack_from(data, next_offset)[0]
             next_offset += 4
 
-        return RecordHeader(tag_id=tag_id, level=level, size=size), next_offset
+        return _tuple_new(RecordHeader, (tag_id, level, size)), next_offset
 
     @classmethod
-    def iter_records(cls, data: bytes) -> Iterator[Record]:
+    def iter_records(cls, data: bytes | memoryview) -> Iterator[Record]:
         """
         섹션 데이터에서 레코드 순회
 
         Args:
             data: 압축 해제된 섹션 데이터
+                (memoryview를 넘기면 레코드 데이터도 복사 없는 memoryview 슬라이스)
 
         Yields:
             Record 객체
         """
         offset = 0
         data_len = len(data)
+        # 루프 안 속성/전역 조회를 지역 변수로
+        parse_header = cls.parse_header
+        tuple_new = _tuple_new
 
         while offset < data_len:
             try:
-                header, next_offset = cls.parse_header(data, offset)
+                header, next_offset = parse_header(data, offset)
             except ValueError:
                 break
 
             # 레코드 데이터 추출
-            record_end = next_offset + header.size
+            size = header.size
+            record_end = next_offset + size
             if record_end > data_len:
                 # 데이터 부족: 남은 부분만 사용
                 record_data = data[next_offset:]
             else:
                 record_data = data[next_offset:record_end]
 
-            yield Record(header=header, data=record_data)
+            yield tuple_new(Record, (header, record_data))
+
+            offset = record_end
+
+    @staticmethod
+    def _iter_para_text_data(data: bytes | memoryview) -> Iterator[bytes | memoryview]:
+        """
+        PARA_TEXT 레코드 데이터만 순회
+
+        iter_records()와 같은 규칙으로 헤더를 읽되, 다른 태그는
+        RecordHeader/Record 객체를 만들지 않고 오프셋만 건너뜀
+
+        Args:
+            data: 압축 해제된 섹션 데이터
+
+        Yields:
+            PARA_TEXT 레코드 데이터
+        """
+        offset = 0
+        data_len = len(data)
+        unpack_from = _UINT32_STRUCT.unpack_from
 
-            offset = next_offset + header.size
+        while offset + 4 <= data_len:
+            header_val = unpack_from(data, offset)[0]
+            size = header_val >> 20
+            offset += 4
+
+            # 확장 크기 (Size == 0xFFF)
+            if size == 0xFFF:
+                if offset + 4 > data_len:
+                    break
+                size = unpack_from(data, offset)[0]
+                offset += 4
+
+            if header_val & 0x3FF == HWPTAG_PARA_TEXT:
+                # 데이터 부족 시 슬라이스가 남은 부분까지로 잘림
+                yield data[offset:offset + size]
+
+            offset += size
 
     @classmethod
     def extract_text_from_section(cls, section_data: bytes) -> str:
@@ -114,17 +175,18 @@ class RecordParser:
             추출된 텍스트
         """
         texts = []
+        decode = cls._decode_para_text
 
-        for record in cls.iter_records(section_data):
-            if record.header.tag_id == HWPTAG_PARA_TEXT:
-                text = cls._decode_para_text(record.data)
-                if text:
-                    texts.append(text)
+        # memoryview로 감싸 레코드 데이터를 복사 없이 슬라이스
+        for data in cls._iter_para_text_data(memoryview(section_data)):
+            text = decode(data)
+            if text:
+                texts.append(text)
 
         return "\n".join(texts)
 
     @classmethod
-    def _decode_para_text(cls, data: bytes) -> str:
+    def _decode_para_text(cls, data: bytes | memoryview) -> str:
         """
         PARA_TEXT 레코드 디코딩
 
@@ -140,21 +202,32 @@ class RecordParser:
         if not data:
             return ""
 
-        # UTF-16LE 디코딩
+        # UTF-16LE 디코딩 (bytes/memoryview 모두 지원, memoryview는 decode 메서드 없음)
         try:
-            text = data.decode(DEFAULT_ENCODING, errors="replace")
+            text = str(data, DEFAULT_ENCODING, "replace")
         except Exception:
             return ""
 
-        # 제어 문자 처리
+        # 탭/줄바꿈/단락 구분 외 제어 문자가 없는 레코드 (대부분):
+        # 단락 구분(CR)만 줄바꿈으로 치환 (str.translate는 비 ASCII 문자열에서 느림)
+        if _DROP_CTRL_CHAR_RE.search(text) is None:
+            return text.replace("\r", "\n").strip()
+
+        # 제어 문자 처리: 글자 단위 순회 대신 정규식(C 구현)으로 제어 문자 위치만 찾고
+        # 그 사이의 일반 텍스트 구간은 슬라이스로 통째 복사
+        search = _CTRL_CHAR_RE.search
+        skip = _CTRL_SKIP
         result = []
-        i = 0
-        text_len = len(text)
+        pos = 0
+        match = search(text)
 
-        while i < text_len:
-            char = text[i]
-            code = ord(char)
+        while match is not None:
+            i = match.start()
+            if i > pos:
+                result.append(text[pos:i])
 
+            code = ord(text[i])
+            pos = i + 1
             if code == CTRL_CHAR_PARA_BREAK:
                 # 단락 구분 → 줄바꿈
                 result.append("\n")
@@ -164,17 +237,14 @@ class RecordParser:
             elif code == 0x0009:
                 # 탭
                 result.append("\t")
-            elif code in cls.FILTER_CHARS:
-                # 확장 제어 문자: 스킵
-                # 일부는 추가 데이터를 가짐 (inline 객체)
-                if code in (0x0001, 0x0002, 0x0003, 0x000B, 0x000C):
-                    # 8글자 추가 데이터 스킵
-                    i += 8
-            elif code >= 0x0020:
-                # 일반 문자
-                result.append(char)
-
-            i += 1
+            else:
+                # 확장 제어 문자 (inline 객체): 8글자 추가 데이터 스킵
+                # 그 외 제어 문자 (NUL 포함): 해당 문자만 스킵
+                pos += skip[code]
+
+            match = search(text, pos)
+
+        result.append(text[pos:])
 
         return "".join(result).strip()
 
@@ -189,11 +259,21 @@ class RecordParser:
         Returns:
             전체 텍스트
         """
-        all_texts = []
+        # 섹션별 "\n".join 후 다시 "\n\n".join 하지 않도록
+        # 구분자를 직접 끼워 넣어 전체를 한 번만 join
+        parts = []
+        decode = cls._decode_para_text
+        iter_para_text_data = cls._iter_para_text_data
 
         for section_name, section_data in sections:
-            text = cls.extract_text_from_section(section_data)
-            if text:
-                all_texts.append(text)
+            # 섹션 구분 (앞 섹션에 텍스트가 있을 때만)
+            sep = "\n\n" if parts else ""
+            for data in iter_para_text_data(memoryview(section_data)):
+                text = decode(data)
+                if text:
+                    if sep:
+                        parts.append(sep)
+                    parts.append(text)
+                    sep = "\n"
 
-        return "\n\n".join(all_texts)
+        return "".join(parts)
@@ -3,6 +3,9 @@
 문서 구조(단락, 테이블, 섹션)를 보존하여 YAML로 변환
 """
 
+import re
+import struct
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from typing import Iterator, Any
 from enum import Enum, auto
@@ -20,6 +23,19 @@ from .constants import (
 )
 from .record import RecordParser, Record
 
+# 고정 레이아웃 헤더 (리틀 엔디안)
+_PARA_HEADER_STRUCT = struct.Struct("<4xI")    # nChars(건너뜀), nControlMask
+_TABLE_HEADER_STRUCT = struct.Struct("<4xHH")  # 속성(건너뜀), nRows, nCols
+
+# PARA_TEXT 제어 문자 (0x0000-0x001F)
+_CTRL_CHAR_RE = re.compile(r"[\x00-\x1f]")
+
+# 확장 제어 문자 (뒤에 8글자 추가 데이터 있음) 비트마스크: bit k = 코드 k
+_EXTENDED_CTRL_MASK = sum(1 << code for code in (
+    0x0001, 0x0002, 0x0003, 0x0004, 0x0005, 0x0006, 0x0007, 0x0008,
+    0x000B, 0x000C, 0x0015, 0x0016, 0x0017, 0x0018, 0x0019,
+))
+
 
 class ControlType(Enum):
     """컨트롤 타입"""
@@ -30,7 +46,19 @@ class ControlType(Enum):
     UNKNOWN = auto()
 
 
-@dataclass
+# 컨트롤 ID → 타입 (저장 방향과 무관하도록 정/역순 모두 등록)
+_CTRL_MAP: dict[bytes, ControlType] = {}
+for _sig, _ctrl_type in (
+    (b"tbl ", ControlType.TABLE),
+    (b"gso ", ControlType.SHAPE),
+    (b"eqed", ControlType.EQUATION),
+):
+    _CTRL_MAP[_sig] = _ctrl_type
+    _CTRL_MAP[_sig[::-1]] = _ctrl_type
+del _sig, _ctrl_type
+
+
+@dataclass(slots=True)
 class TableCell:
     """테이블 셀"""
     row: int
@@ -40,7 +68,7 @@ class TableCell:
     col_span: int = 1
 
 
-@dataclass
+@dataclass(slots=True)
 class Table:
     """테이블 구조"""
     rows: int
@@ -49,10 +77,11 @@ class Table:
 
     def to_dict(self) -> dict:
         """딕셔너리 변환"""
-        # 2D 배열로 변환
-        grid = [["" for _ in range(self.cols)] for _ in range(self.rows)]
+        # 2D 배열로 변환 (행 단위 리스트 곱셈으로 생성)
+        rows, cols = self.rows, self.cols
+        grid = [[""] * cols for _ in range(rows)]
         for cell in self.cells:
-            if 0 <= cell.row < self.rows and 0 <= cell.col < self.cols:
+            if 0 <= cell.row < rows and 0 <= cell.col < cols:
                 grid[cell.row][cell.col] = cell.text
 
         return {
@@ -62,7 +91,7 @@ class Table:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Paragraph:
     """단락 구조"""
     text: str
@@ -76,7 +105,7 @@ class Paragraph:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Section:
     """섹션 구조"""
     index: int
@@ -91,7 +120,7 @@ class Section:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class DocumentStructure:
     """전체 문서 구조"""
     sections: list[Section] = field(default_factory=list)
@@ -130,6 +159,10 @@ class StructureParser:
     CTRL_EQUATION = b"eqed"   # 수식
 
     def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        """파서 상태 초기화 (섹션 간 인스턴스 재사용)"""
         self.current_section: Section | None = None
         self.current_table: Table | None = None
         self.current_cell_row: int = 0
@@ -150,19 +183,13 @@ class StructureParser:
         Returns:
             Section 객체
         """
+        self.reset()
         section = Section(index=section_idx)
         self.current_section = section
-        self.in_table = False
-        self.in_cell = False  # Fix #3: 셀 상태 초기화
-        self.current_table = None
-        self.table_start_level = None  # Fix #1: 테이블 시작 레벨 초기화
-        self.current_para_texts = []  # Fix #2: 단락 텍스트 버퍼 초기화
-
-        records = list(RecordParser.iter_records(section_data))
 
-        i = 0
-        while i < len(records):
-            record = records[i]
+        # 레코드는 생성되는 즉시 소비 (전체 목록을 메모리에 유지하지 않음)
+        # memoryview로 감싸 레코드 데이터를 복사 없이 슬라이스
+        for record in RecordParser.iter_records(memoryview(section_data)):
             tag_id = record.header.tag_id
             level = record.header.level
 
@@ -179,7 +206,7 @@ class StructureParser:
 
                 # 단락 헤더 - 컨트롤 마스크 확인
                 ctrl_mask = self._parse_para_header(record.data)
-                self.current_para_texts = []  # 새 단락 시작
+                self.current_para_texts.clear()  # 새 단락 시작
 
             elif tag_id == HWPTAG_PARA_TEXT:
                 # Fix #2: 다중 레코드 단락 누적
@@ -203,7 +230,7 @@ class StructureParser:
                     self.in_table = True
                     self.in_cell = False
                     self.table_start_level = level  # Fix #1: 테이블 시작 레벨 저장
-                    self.cell_texts = []
+                    self.cell_texts.clear()
                     self.current_cell_row = 0
                     self.current_cell_col = 0
 
@@ -234,8 +261,6 @@ class StructureParser:
                     self._advance_to_next_cell()
                     self.in_cell = True
 
-            i += 1
-
         # Fix #2: 마지막 단락 처리
         self._finalize_paragraph(section, 0)
 
@@ -250,11 +275,10 @@ class StructureParser:
         if not self.current_para_texts:
             return
 
+        # 각 조각은 _decode_para_text에서 strip된 비어 있지 않은 문자열이므로
+        # 합친 결과도 앞뒤 공백이 없음 (추가 strip 불필요)
         full_text = "".join(self.current_para_texts)
-        self.current_para_texts = []
-
-        if not full_text.strip():
-            return
+        self.current_para_texts.clear()
 
         if self.in_table:
             # 테이블 셀 내부 텍스트
@@ -278,7 +302,7 @@ class StructureParser:
         self.in_table = False
         self.in_cell = False
         self.table_start_level = None
-        self.cell_texts = []
+        self.cell_texts.clear()
 
     def _save_current_cell(self) -> None:
         """Fix #3: 현재 셀 텍스트를 테이블에 저장 (범위 검사 포함)"""
@@ -289,17 +313,20 @@ class StructureParser:
         if not (0 <= self.current_cell_row < self.current_table.rows and
                 0 <= self.current_cell_col < self.current_table.cols):
             # 범위 초과 시 경고 로그만 남기고 진행 (silent drop 대신)
-            self.cell_texts = []
+            self.cell_texts.clear()
             return
 
-        cell_text = "\n".join(self.cell_texts)
+        # 단일 단락 셀(일반적인 경우)은 join 생략
+        # (단락 텍스트는 이미 앞뒤 공백이 제거된 상태)
+        cell_texts = self.cell_texts
+        cell_text = cell_texts[0] if len(cell_texts) == 1 else "\n".join(cell_texts)
         cell = TableCell(
             row=self.current_cell_row,
             col=self.current_cell_col,
-            text=cell_text.strip(),
+            text=cell_text,
         )
         self.current_table.cells.append(cell)
-        self.cell_texts = []
+        self.cell_texts.clear()
 
     def _advance_to_next_cell(self) -> None:
         """다음 셀로 이동"""
@@ -311,7 +338,7 @@ class StructureParser:
             self.current_cell_col = 0
             self.current_cell_row += 1
 
-    def _parse_para_header(self, data: bytes) -> int:
+    def _parse_para_header(self, data: bytes | memoryview) -> int:
         """PARA_HEADER 파싱
 
         구조 (최소 22바이트):
@@ -327,10 +354,9 @@ class StructureParser:
         if len(data) < 8:
             return 0
 
-        ctrl_mask = int.from_bytes(data[4:8], "little")
-        return ctrl_mask
+        return _PARA_HEADER_STRUCT.unpack_from(data)[0]
 
-    def _parse_ctrl_header(self, data: bytes) -> ControlType:
+    def _parse_ctrl_header(self, data: bytes | memoryview) -> ControlType:
         """CTRL_HEADER 파싱
 
         구조:
@@ -342,20 +368,11 @@ class StructureParser:
         if len(data) < 4:
             return ControlType.UNKNOWN
 
-        ctrl_id = data[0:4]
-
         # 컨트롤 ID는 리틀 엔디안으로 저장된 4글자 문자열
         # "tbl " -> b"\x20lbt" -> b"tbl "
-        if ctrl_id == self.CTRL_TABLE or ctrl_id == self.CTRL_TABLE[::-1]:
-            return ControlType.TABLE
-        elif ctrl_id == self.CTRL_SHAPE or ctrl_id == self.CTRL_SHAPE[::-1]:
-            return ControlType.SHAPE
-        elif ctrl_id == self.CTRL_EQUATION or ctrl_id == self.CTRL_EQUATION[::-1]:
-            return ControlType.EQUATION
-
-        return ControlType.UNKNOWN
+        return _CTRL_MAP.get(bytes(data[:4]), ControlType.UNKNOWN)
 
-    def _parse_table_header(self, data: bytes) -> tuple[int, int]:
+    def _parse_table_header(self, data: bytes | memoryview) -> tuple[int, int]:
         """TABLE 레코드 파싱
 
         구조:
@@ -371,8 +388,7 @@ class StructureParser:
         if len(data) < 8:
             return (1, 1)
 
-        rows = int.from_bytes(data[4:6], "little")
-        cols = int.from_bytes(data[6:8], "little")
+        rows, cols = _TABLE_HEADER_STRUCT.unpack_from(data)
 
         # 최소값 보정
         rows = max(1, rows)
@@ -380,7 +396,7 @@ class StructureParser:
 
         return (rows, cols)
 
-    def _decode_para_text(self, data: bytes) -> str:
+    def _decode_para_text(self, data: bytes | memoryview) -> str:
         """PARA_TEXT 레코드 디코딩
 
         HWP 텍스트는 UTF-16LE로 인코딩되며,
@@ -389,65 +405,81 @@ class StructureParser:
         if not data:
             return ""
 
+        # bytes/memoryview 모두 지원 (memoryview는 decode 메서드 없음)
         try:
-            text = data.decode(DEFAULT_ENCODING, errors="replace")
+            text = str(data, DEFAULT_ENCODING, "replace")
         except Exception:
             return ""
 
-        # 제어 문자 처리
-        result = []
-        i = 0
-        text_len = len(text)
+        search = _CTRL_CHAR_RE.search
+        match = search(text)
 
-        # 모든 제어 문자 (탭, 줄바꿈, 단락구분 제외)
-        FILTER_CHARS = set(range(0x0001, 0x0020)) - {0x000A, 0x000D, 0x0009}
+        # 제어 문자가 없는 레코드 (대부분): 디코딩 결과 그대로 사용
+        if match is None:
+            return text.strip()
 
-        # 확장 제어 문자 (뒤에 8글자 추가 데이터 있음)
-        EXTENDED_CTRL_CHARS = {0x0001, 0x0002, 0x0003, 0x000B, 0x000C,
-                               0x0004, 0x0005, 0x0006, 0x0007, 0x0008,
-                               0x0015, 0x0016, 0x0017, 0x0018, 0x0019}
+        # 제어 문자 처리: 제어 문자 사이의 일반 텍스트 구간은 슬라이스로 통째 복사
+        result = []
+        pos = 0
 
-        while i < text_len:
-            char = text[i]
-            code = ord(char)
+        while match is not None:
+            i = match.start()
+            if i > pos:
+                result.append(text[pos:i])
 
-            if code == CTRL_CHAR_PARA_BREAK:
-                result.append("\n")
-                i += 1
-            elif code == CTRL_CHAR_LINE_BREAK:
+            code = ord(text[i])
+            if code == CTRL_CHAR_PARA_BREAK or code == CTRL_CHAR_LINE_BREAK:
                 result.append("\n")
-                i += 1
+                pos = i + 1
             elif code == 0x0009:
                 result.append("\t")
-                i += 1
-            elif code in EXTENDED_CTRL_CHARS:
+                pos = i + 1
+            elif (_EXTENDED_CTRL_MASK >> code) & 1:
                 # 확장 제어 문자: 현재 + 7글자(총 8글자/16바이트) 추가 데이터 스킵
-                i += 8
-            elif code in FILTER_CHARS:
-                # 기타 제어 문자: 해당 문자만 스킵
-                i += 1
-            elif code >= 0x0020:
-                result.append(char)
-                i += 1
+                pos = i + 8
             else:
-                i += 1
+                # 기타 제어 문자 (NUL 포함): 해당 문자만 스킵
+                pos = i + 1
+
+            match = search(text, pos)
+
+        result.append(text[pos:])
 
         return "".join(result).strip()
 
 
-def extract_hwp5_structure(sections: list[tuple[str, bytes]]) -> DocumentStructure:
+def _parse_section_worker(args: tuple[int, bytes]) -> Section:
+    """워커 프로세스에서 실행되는 섹션 파싱 함수"""
+    idx, section_data = args
+    return StructureParser().parse_section(idx, section_data)
+
+
+def extract_hwp5_structure(
+    sections: list[tuple[str, bytes]],
+    workers: int = 1,
+) -> DocumentStructure:
     """HWP 5.x 문서 구조 추출
 
     Args:
         sections: [(섹션이름, 압축해제된 데이터), ...]
+        workers: 섹션 병렬 파싱 프로세스 수 (기본 1: 순차 처리).
+            배치 처리처럼 이미 파일 단위로 병렬화된 경우에는 1 유지
 
     Returns:
         DocumentStructure 객체
     """
     doc = DocumentStructure()
 
+    if workers > 1 and len(sections) > 1:
+        # 섹션은 서로 독립적이므로 프로세스 풀에서 병렬 파싱 (순서 유지)
+        tasks = [(idx, data) for idx, (_, data) in enumerate(sections)]
+        with ProcessPoolExecutor(max_workers=min(workers, len(sections))) as executor:
+            doc.sections.extend(executor.map(_parse_section_worker, tasks))
+        return doc
+
+    parser = StructureParser()
+
     for idx, (section_name, section_data) in enumerate(sections):
-        parser = StructureParser()
         section = parser.parse_section(idx, section_data)
         doc.sections.append(section)
 
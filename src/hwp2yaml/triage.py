@@ -1,11 +1,17 @@
 """HWP 파일 트리아지 (버전 감지 및 분류)"""
 
 import os
+import stat
 from enum import Enum
 from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Callable
 
-from .utils import is_hwpx
+from tqdm import tqdm
+
+from .constants import PROGRESS_MININTERVAL
+from .utils import is_hwpx, iter_hwp_files
 
 
 class HWPVersion(Enum):
@@ -22,7 +28,7 @@ ZIP_SIGNATURE = b"PK\x03\x04"
 HWP3_SIGNATURE = b"HWP Document File"  # HWP 3.x 시작 부분
 
 
-@dataclass
+@dataclass(slots=True)
 class TriageResult:
     """트리아지 결과"""
     filepath: str
@@ -36,84 +42,62 @@ def detect_hwp_version(filepath: str) -> HWPVersion:
     """
     HWP 파일 버전 감지
 
+    결과는 (경로, mtime, 크기) 기준으로 캐시 (재트리아지 시 재읽기 없음)
+
     Args:
         filepath: HWP 파일 경로
 
     Returns:
         HWPVersion enum
     """
-    if not os.path.isfile(filepath):
-        return HWPVersion.UNKNOWN
+    return _stat_and_detect(filepath)[0]
+
+
+def _stat_and_detect(filepath: str) -> tuple[HWPVersion, int]:
+    """
+    stat 1회로 (버전, 파일 크기) 반환
 
+    일반 파일이 아니거나 stat 실패 시 (UNKNOWN, 0)
+    """
+    try:
+        st = os.stat(filepath)
+    except (OSError, ValueError):
+        return HWPVersion.UNKNOWN, 0
+    if not stat.S_ISREG(st.st_mode):
+        return HWPVersion.UNKNOWN, 0
+    return _detect_cached(filepath, st.st_mtime_ns, st.st_size), st.st_size
+
+
+@lru_cache(maxsize=4096)
+def _detect_cached(filepath: str, mtime_ns: int, size: int) -> HWPVersion:
+    """시그니처 기반 버전 감지 (mtime/크기가 바뀌면 캐시 키가 달라져 재감지)"""
     try:
         with open(filepath, "rb") as f:
             header = f.read(32)
 
         # 1. HWPX 확인 (ZIP 시그니처)
-        if header[:4] == ZIP_SIGNATURE:
-            if is_hwpx(filepath):
+        if header.startswith(ZIP_SIGNATURE):
+            if is_hwpx(filepath, _skip_sig_check=True):
                 return HWPVersion.HWPX
             return HWPVersion.UNKNOWN
 
         # 2. OLE2 확인 (HWP 5.x)
-        if header[:8] == OLE2_SIGNATURE:
-            # OLE2 파일 내부에서 HWP 시그니처 확인
-            try:
-                import olefile
-                ole = olefile.OleFileIO(filepath)
-                if ole.exists("FileHeader"):
-                    file_header = ole.openstream("FileHeader").read(32)
-                    if file_header[:17] == HWP3_SIGNATURE:
-                        ole.close()
-                        return HWPVersion.HWP_5X
-                ole.close()
-            except Exception:
-                pass
-            return HWPVersion.HWP_5X  # OLE2이면 일단 5.x로 간주
+        # 내부 FileHeader 검증 결과와 무관하게 OLE2이면 5.x로 판정하므로
+        # olefile로 컨테이너를 열지 않음 (상세 검증은 HWPReader에서 수행)
+        if header.startswith(OLE2_SIGNATURE):
+            return HWPVersion.HWP_5X
 
         # 3. HWP 3.x 확인
         # HWP 3.x는 고유한 바이너리 포맷
-        # 첫 바이트가 특정 패턴인지 확인
-        if header[:17] == HWP3_SIGNATURE:
+        # "HWP Document File V3.00" 등 버전 문자열로 시작
+        if header.startswith(HWP3_SIGNATURE):
             return HWPVersion.HWP_3X
 
-        # 파일 명령으로 추가 확인
-        return _detect_by_file_command(filepath)
-
-    except Exception:
+        # file(1) 명령의 HWP 판정도 위 시그니처에 기반하므로 추가 확인 없음
         return HWPVersion.UNKNOWN
 
-
-def _detect_by_file_command(filepath: str) -> HWPVersion:
-    """file 명령으로 HWP 버전 감지 (폴백)"""
-    import subprocess
-
-    try:
-        result = subprocess.run(
-            ["file", "-b", filepath],
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-        output = result.stdout.lower()
-
-        if "version 3" in output:
-            return HWPVersion.HWP_3X
-        elif "version 5" in output:
-            return HWPVersion.HWP_5X
-        elif "hwpx" in output:
-            return HWPVersion.HWPX
-        elif "hwp" in output:
-            # 버전 불명확하면 OLE2 여부로 판단
-            with open(filepath, "rb") as f:
-                if f.read(8) == OLE2_SIGNATURE:
-                    return HWPVersion.HWP_5X
-            return HWPVersion.HWP_3X
-
     except Exception:
-        pass
-
-    return HWPVersion.UNKNOWN
+        return HWPVersion.UNKNOWN
 
 
 def triage_file(filepath: str) -> TriageResult:
@@ -126,8 +110,7 @@ def triage_file(filepath: str) -> TriageResult:
     Returns:
         TriageResult
     """
-    version = detect_hwp_version(filepath)
-    file_size = os.path.getsize(filepath) if os.path.isfile(filepath) else 0
+    version, file_size = _stat_and_detect(filepath)
 
     can_process = version in (HWPVersion.HWP_5X, HWPVersion.HWPX)
 
@@ -147,7 +130,7 @@ def triage_file(filepath: str) -> TriageResult:
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class TriageSummary:
     """트리아지 요약"""
     total: int
@@ -164,13 +147,21 @@ class TriageSummary:
     unknown_files: list[str]
 
 
-def triage_files(filepaths: list[str], progress: bool = True) -> TriageSummary:
+def triage_files(
+    filepaths: list[str],
+    progress: bool = True,
+    workers: int | None = None,
+) -> TriageSummary:
     """
     파일 목록 트리아지
 
+    시그니처 읽기는 I/O 대기가 대부분이므로 스레드 풀에서 병렬 처리
+    (결과는 입력 순서대로 집계)
+
     Args:
         filepaths: HWP 파일 경로 목록
         progress: 진행률 표시
+        workers: 스레드 수 (기본: ThreadPoolExecutor 기본값)
 
     Returns:
         TriageSummary
@@ -180,25 +171,25 @@ def triage_files(filepaths: list[str], progress: bool = True) -> TriageSummary:
     hwpx_files = []
     unknown_files = []
 
-    iterator = filepaths
-    if progress:
-        try:
-            from tqdm import tqdm
-            iterator = tqdm(filepaths, desc="트리아지")
-        except ImportError:
-            pass
-
-    for filepath in iterator:
-        result = triage_file(filepath)
-
-        if result.version == HWPVersion.HWP_3X:
-            hwp3_files.append(filepath)
-        elif result.version == HWPVersion.HWP_5X:
-            hwp5_files.append(filepath)
-        elif result.version == HWPVersion.HWPX:
-            hwpx_files.append(filepath)
-        else:
-            unknown_files.append(filepath)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        iterator = executor.map(triage_file, filepaths)
+        if progress:
+            iterator = tqdm(
+                iterator, total=len(filepaths), desc="트리아지",
+                mininterval=PROGRESS_MININTERVAL,
+            )
+
+        for result in iterator:
+            filepath = result.filepath
+
+            if result.version == HWPVersion.HWP_3X:
+                hwp3_files.append(filepath)
+            elif result.version == HWPVersion.HWP_5X:
+                hwp5_files.append(filepath)
+            elif result.version == HWPVersion.HWPX:
+                hwpx_files.append(filepath)
+            else:
+                unknown_files.append(filepath)
 
     return TriageSummary(
         total=len(filepaths),
@@ -227,9 +218,6 @@ def triage_directory(directory: str, recursive: bool = True, progress: bool = Tr
     Returns:
         TriageSummary
     """
-    import glob
-
-    pattern = "**/*.hwp" if recursive else "*.hwp"
-    filepaths = glob.glob(os.path.join(directory, pattern), recursive=recursive)
+    filepaths = list(iter_hwp_files(directory, recursive))
 
     return triage_files(filepaths, progress=progress)
@@ -1,13 +1,30 @@
 """HWP 파서 유틸리티"""
 
+import os
 import re
 import zipfile
+from typing import Iterator
 import xml.etree.ElementTree as ET
+import xml.sax
+from xml.sax.handler import ContentHandler
 from pathlib import Path
 import logging
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
+# 후처리 정규식 (모듈 로드 시 1회 컴파일)
+_TABLE_CELL_RE = re.compile(r"<([^>]*)>")
+_SPACES_RE = re.compile(r"[ \t]+")
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+_CTRL_CHARS_RE = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+_CTRL_TABLE = dict.fromkeys([*range(0x00, 0x09), 0x0B, 0x0C, *range(0x0E, 0x20)])
+
+# HWPX 파싱 정규식
+_SECTION_NUM_RE = re.compile(r"section(\d+)\.xml", re.IGNORECASE)
+_XMLNS_RE = re.compile(r'\sxmlns[^=]*="[^"]*"')
+_TAG_PREFIX_RE = re.compile(r"<(/?)(\w+):")
+
 
 def _sort_section_files(files: list[str]) -> list[str]:
     """
@@ -25,7 +42,7 @@ def _sort_section_files(files: list[str]) -> list[str]:
     def extract_section_num(filepath: str) -> int:
         """파일명에서 섹션 번호 추출"""
         # "Contents/section0.xml" → 0, "section10.xml" → 10
-        match = re.search(r'section(\d+)\.xml', filepath, re.IGNORECASE)
+        match = _SECTION_NUM_RE.search(filepath)
         if match:
             return int(match.group(1))
         return 0  # 숫자 없으면 맨 앞으로
@@ -50,19 +67,24 @@ def convert_table_tags_to_markdown(text: str) -> str:
     Returns:
         변환된 텍스트
     """
+    # 표 태그가 있을 수 없으면 줄 분할/정규식 스캔 생략
+    if "<" not in text or ">" not in text:
+        return text
+
     lines = text.split("\n")
     result = []
     table_rows = []
     in_table = False
 
+    find_cells = _TABLE_CELL_RE.findall
+
     for line in lines:
-        # 표 행 감지: <...><...> 패턴
-        if re.search(r"<[^>]+>.*<[^>]+>", line):
-            # 셀 추출
-            cells = re.findall(r"<([^>]*)>", line)
-            if cells:
-                table_rows.append(cells)
-                in_table = True
+        # 셀 추출과 표 행 감지를 한 번의 스캔으로 처리
+        # (내용이 있는 <...> 셀이 2개 이상이면 표 행)
+        cells = find_cells(line)
+        if len(cells) - cells.count("") >= 2:
+            table_rows.append(cells)
+            in_table = True
         else:
             # 표 종료 시 마크다운으로 변환
             if in_table and table_rows:
@@ -83,34 +105,48 @@ def _rows_to_markdown(rows: list[list[str]]) -> list[str]:
     if not rows:
         return []
 
+    # 셀 공백 정리는 행마다 1회
+    rows = [[cell.strip() for cell in row] for row in rows]
+
     # 열 너비 계산
     col_count = max(len(row) for row in rows)
     col_widths = [0] * col_count
 
     for row in rows:
         for i, cell in enumerate(row):
-            if i < col_count:
-                col_widths[i] = max(col_widths[i], len(cell.strip()))
+            if len(cell) > col_widths[i]:
+                col_widths[i] = len(cell)
 
-    # 마크다운 생성
-    md_lines = []
-    for i, row in enumerate(rows):
-        # 셀 패딩
-        padded = []
-        for j in range(col_count):
-            cell = row[j].strip() if j < len(row) else ""
-            padded.append(cell.ljust(col_widths[j]))
+    # 마크다운 생성: 열 너비를 반영한 행 포맷을 한 번만 만들고 재사용
+    row_format = "| " + " | ".join(f"{{:<{w}}}" for w in col_widths) + " |"
+    blanks = [""] * col_count
+    md_lines = [row_format.format(*row, *blanks[len(row):]) for row in rows]
 
-        md_lines.append("| " + " | ".join(padded) + " |")
-
-        # 헤더 구분선 (첫 행 이후)
-        if i == 0:
-            separators = ["-" * max(3, w) for w in col_widths]
-            md_lines.append("| " + " | ".join(separators) + " |")
+    # 헤더 구분선 (첫 행 이후)
+    separators = ["-" * max(3, w) for w in col_widths]
+    md_lines.insert(1, "| " + " | ".join(separators) + " |")
 
     return md_lines
 
 
+def _split_hwpx_names(namelist: list[str]) -> tuple[list[str], list[str]]:
+    """
+    HWPX 내부 파일 목록을 한 번 순회하여 분류
+
+    Returns:
+        (PrvText 경로 목록, 숫자 기준 정렬된 section*.xml 목록)
+    """
+    prvtext_paths = []
+    section_files = []
+    for name in namelist:
+        name_lower = name.lower()
+        if "prvtext" in name_lower:
+            prvtext_paths.append(name)
+        if "section" in name_lower and name.endswith(".xml"):
+            section_files.append(name)
+    return prvtext_paths, _sort_section_files(section_files)
+
+
 def extract_hwpx_text(filepath: str) -> str | None:
     """
     HWPX (XML 기반) 파일에서 텍스트 추출
@@ -125,33 +161,25 @@ def extract_hwpx_text(filepath: str) -> str | None:
     """
     try:
         with zipfile.ZipFile(filepath, "r") as zf:
-            namelist = zf.namelist()
+            prvtext_paths, section_files = _split_hwpx_names(zf.namelist())
 
             # 1. Preview/PrvText.txt 시도 (가장 쉬운 방법)
-            prvtext_paths = [n for n in namelist if "prvtext" in n.lower()]
             for prvtext_path in prvtext_paths:
                 try:
-                    with zf.open(prvtext_path) as f:
-                        text = f.read().decode("utf-8", errors="replace").strip()
-                        if text:
-                            return text
+                    text = zf.read(prvtext_path).decode("utf-8", errors="replace").strip()
+                    if text:
+                        return text
                 except Exception:
                     continue
 
             # 2. Contents/section*.xml 파일에서 텍스트 추출
             texts = []
-            section_files = _sort_section_files([
-                n for n in namelist
-                if "section" in n.lower() and n.endswith(".xml")
-            ])
 
             for name in section_files:
                 try:
-                    with zf.open(name) as f:
-                        content = f.read().decode("utf-8")
-                        section_text = _parse_hwpx_section(content)
-                        if section_text:
-                            texts.append(section_text)
+                    section_text = _stream_hwpx_section_text(zf, name)
+                    if section_text:
+                        texts.append(section_text)
                 except Exception:
                     continue
 
@@ -161,8 +189,66 @@ def extract_hwpx_text(filepath: str) -> str | None:
         return None
 
 
-def _parse_hwpx_section(xml_content: str) -> str:
-    """HWPX 섹션 XML 파싱 (Fix #5: namespace-safe)"""
+class _SectionTextHandler(ContentHandler):
+    """
+    HWPX 섹션 평문 수집용 SAX 핸들러
+
+    _extract_text_preserving_whitespace와 같은 규칙으로 text/tail을 모은다.
+    (각 조각은 해당 요소의 xml:space="preserve"일 때만 공백 유지)
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.texts: list[str] = []
+        self._buf: list[str] = []
+        self._preserve_stack: list[bool] = []
+        self._preserve = False
+
+    def _flush(self) -> None:
+        if self._buf:
+            text = "".join(self._buf)
+            self._buf.clear()
+            if not self._preserve:
+                text = text.strip()
+            if text:
+                self.texts.append(text)
+
+    def startElement(self, name, attrs):
+        # 부모의 text 또는 직전 형제의 tail 확정
+        self._flush()
+        self._preserve = attrs.get("xml:space") == "preserve"
+        self._preserve_stack.append(self._preserve)
+
+    def endElement(self, name):
+        # 현재 요소의 text 또는 마지막 자식의 tail 확정 → 이후는 현재 요소의 tail
+        self._flush()
+        self._preserve = self._preserve_stack.pop()
+
+    def characters(self, content):
+        self._buf.append(content)
+
+
+def _stream_hwpx_section_text(zf: zipfile.ZipFile, name: str) -> str:
+    """
+    HWPX 섹션 평문 스트리밍 추출
+
+    트리를 만들지 않고 SAX로 읽어 섹션 크기와 무관하게 메모리 사용이 일정.
+    SAX 파싱 실패 시에만 전체를 읽어 _parse_hwpx_section(fallback 포함)으로 처리.
+    """
+    handler = _SectionTextHandler()
+    try:
+        with zf.open(name) as f:
+            xml.sax.parse(f, handler)
+    except xml.sax.SAXException:
+        return _parse_hwpx_section(zf.read(name))
+    return "\n".join(handler.texts)
+
+
+def _parse_hwpx_section(xml_content: str | bytes) -> str:
+    """HWPX 섹션 XML 파싱 (Fix #5: namespace-safe)
+
+    bytes는 디코딩 없이 파서에 직접 전달 (fallback 경로에서만 디코딩)
+    """
     try:
         # 방법 1: 네임스페이스 유지 파싱 시도
         root = ET.fromstring(xml_content)
@@ -174,6 +260,9 @@ def _parse_hwpx_section(xml_content: str) -> str:
         logger.debug(f"Namespace-aware parsing failed: {e}, trying fallback")
 
     # 방법 2: 네임스페이스 제거 후 재시도 (fallback)
+    if isinstance(xml_content, bytes):
+        xml_content = xml_content.decode("utf-8")
+
     try:
         xml_clean = _strip_namespaces_safe(xml_content)
         root = ET.fromstring(xml_clean)
@@ -220,40 +309,75 @@ def _strip_namespaces_safe(xml_content: str) -> str:
     주의: 이 방법은 의미를 잃을 수 있으므로 fallback으로만 사용
     """
     # xmlns 선언 제거
-    xml_clean = re.sub(r'\sxmlns[^=]*="[^"]*"', "", xml_content)
+    xml_clean = _XMLNS_RE.sub("", xml_content)
     # 태그 접두사 제거 (예: <hp:p> → <p>)
-    xml_clean = re.sub(r'<(/?)(\w+):', r'<\1', xml_clean)
+    xml_clean = _TAG_PREFIX_RE.sub(r"<\1", xml_clean)
     return xml_clean
 
 
-def is_hwpx(filepath: str) -> bool:
+def iter_hwp_files(directory: str, recursive: bool = True) -> Iterator[str]:
+    """
+    디렉토리 내 HWP 파일 경로 순회
+
+    Path.rglob 대신 os.scandir 사용 (항목별 Path 생성/stat 호출 없음).
+    심볼릭 링크 디렉토리는 따라가지 않음 (rglob과 동일).
+
+    Args:
+        directory: 디렉토리 경로
+        recursive: 하위 디렉토리 포함 여부
+
+    Yields:
+        HWP 파일 경로 (문자열)
+    """
+    stack = [os.fspath(directory)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                try:
+                    if entry.name.endswith((".hwp", ".HWP")) and entry.is_file():
+                        yield entry.path
+                    elif recursive and entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                except OSError:
+                    continue
+
+
+def is_hwpx(filepath: str, _skip_sig_check: bool = False) -> bool:
     """
     파일이 HWPX 형식인지 확인
 
     HWPX는 ZIP 압축된 XML 파일 모음으로,
     mimetype 파일 또는 Contents/header.xml이 존재
+
+    Args:
+        filepath: 파일 경로
+        _skip_sig_check: 호출측에서 ZIP 시그니처를 이미 확인한 경우 True
     """
     try:
-        with open(filepath, "rb") as f:
+        # 파일은 한 번만 열고, 같은 핸들로 시그니처 확인과 ZIP 파싱 수행
+        with open(filepath, "rb") as fp:
             # ZIP 시그니처 확인
-            signature = f.read(4)
-            if signature != b"PK\x03\x04":
+            if not _skip_sig_check and fp.read(4) != b"PK\x03\x04":
                 return False
 
-        # HWPX 특정 파일 확인
-        with zipfile.ZipFile(filepath, "r") as zf:
-            namelist = zf.namelist()
-            # HWPX는 mimetype 또는 Contents/header.xml 포함
-            if "mimetype" in namelist:
-                with zf.open("mimetype") as f:
-                    mimetype = f.read().decode("utf-8", errors="ignore").strip()
+            # HWPX 특정 파일 확인
+            with zipfile.ZipFile(fp, "r") as zf:
+                namelist = zf.namelist()
+                names = set(namelist)
+                # HWPX는 mimetype 또는 Contents/header.xml 포함
+                if "mimetype" in names:
+                    mimetype = zf.read("mimetype").decode("utf-8", errors="ignore").strip()
                     if "hwp" in mimetype.lower():
                         return True
-            if "Contents/header.xml" in namelist:
-                return True
-            # section0.xml도 HWPX 특징
-            if any("section" in n and n.endswith(".xml") for n in namelist):
-                return True
+                if "Contents/header.xml" in names:
+                    return True
+                # section0.xml도 HWPX 특징
+                if any("section" in n and n.endswith(".xml") for n in namelist):
+                    return True
 
         return False
 
@@ -270,13 +394,17 @@ def clean_text(text: str) -> str:
     - 특수 제어 문자 제거
     """
     # 연속 공백 → 단일 공백
-    text = re.sub(r"[ \t]+", " ", text)
+    text = _SPACES_RE.sub(" ", text)
 
     # 연속 빈 줄 → 단일 빈 줄
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    text = _BLANK_LINES_RE.sub("\n\n", text)
 
     # 특수 제어 문자 제거
-    text = re.sub(r"[\x00-\x08\x0b\x0c\x0e-\x1f]", "", text)
+    # str.translate는 ASCII 문자열에서만 정규식보다 빠름 (한글 포함 시 더 느림)
+    if text.isascii():
+        text = text.translate(_CTRL_TABLE)
+    else:
+        text = _CTRL_CHARS_RE.sub("", text)
 
     return text.strip()
 
@@ -319,13 +447,8 @@ def extract_hwpx_structure(filepath: str) -> dict | None:
 
     try:
         with zipfile.ZipFile(filepath, "r") as zf:
-            namelist = zf.namelist()
-
             # section*.xml 파일 찾기 (숫자 기준 정렬)
-            section_files = _sort_section_files([
-                n for n in namelist
-                if "section" in n.lower() and n.endswith(".xml")
-            ])
+            _, section_files = _split_hwpx_names(zf.namelist())
 
             if not section_files:
                 return None
@@ -333,11 +456,9 @@ def extract_hwpx_structure(filepath: str) -> dict | None:
             sections = []
             for idx, section_file in enumerate(section_files):
                 try:
-                    with zf.open(section_file) as f:
-                        xml_content = f.read().decode("utf-8")
-                        section_data = _parse_hwpx_section_structure(xml_content, idx)
-                        if section_data:
-                            sections.append(section_data)
+                    section_data = _parse_hwpx_section_structure(zf.read(section_file), idx)
+                    if section_data:
+                        sections.append(section_data)
                 except Exception:
                     continue
 
@@ -350,12 +471,12 @@ def extract_hwpx_structure(filepath: str) -> dict | None:
         return None
 
 
-def _parse_hwpx_section_structure(xml_content: str, section_idx: int) -> dict | None:
+def _parse_hwpx_section_structure(xml_content: str | bytes, section_idx: int) -> dict | None:
     """
     HWPX 섹션 XML에서 구조 추출 (Fix #5: namespace-safe)
 
     Args:
-        xml_content: section*.xml 내용
+        xml_content: section*.xml 내용 (bytes는 디코딩 없이 파싱)
         section_idx: 섹션 인덱스
 
     Returns:
@@ -380,6 +501,9 @@ def _parse_hwpx_section_structure(xml_content: str, section_idx: int) -> dict |
         logger.debug(f"Namespace-aware structure parsing failed: {e}, trying fallback")
 
     # 방법 2: 네임스페이스 제거 후 재시도 (fallback)
+    if isinstance(xml_content, bytes):
+        xml_content = xml_content.decode("utf-8")
+
     try:
         xml_clean = _strip_namespaces_safe(xml_content)
         root = ET.fromstring(xml_clean)
@@ -399,17 +523,22 @@ def _parse_hwpx_section_structure(xml_content: str, section_idx: int) -> dict |
         return None
 
 
+@lru_cache(maxsize=256)
+def _local_name(tag: str) -> str:
+    """Clark 표기 태그에서 소문자 로컬 태그명 추출 (태그 종류가 적어 캐시)"""
+    if tag.startswith("{"):
+        # 네임스페이스 제거
+        return tag.split("}", 1)[1].lower()
+    return tag.lower()
+
+
 def _get_local_tag(element: ET.Element) -> str:
     """
     네임스페이스 제거한 로컬 태그명 추출 (Fix #5)
 
     예: "{http://example.com}p" → "p"
     """
-    tag = element.tag
-    if tag.startswith("{"):
-        # 네임스페이스 제거
-        return tag.split("}", 1)[1].lower()
-    return tag.lower()
+    return _local_name(element.tag)
 
 
 def _extract_structure_recursive(
@@ -419,7 +548,9 @@ def _extract_structure_recursive(
     current_level: int = 0
 ) -> None:
     """
-    XML 요소를 재귀적으로 탐색하여 단락과 테이블 추출 (Fix #5: namespace-safe)
+    XML 요소를 탐색하여 단락과 테이블 추출 (Fix #5: namespace-safe)
+
+    재귀 대신 명시적 스택 사용 (문서 순서 유지)
 
     HWPX 태그 구조:
     - <p> or <para>: 단락
@@ -429,28 +560,31 @@ def _extract_structure_recursive(
     - <tc>: 테이블 셀
     - <run>: 텍스트 런
     """
-    tag = _get_local_tag(element)
-
-    # 테이블 처리
-    if tag in ("tbl", "table"):
-        table_data = _parse_hwpx_table(element)
-        if table_data:
-            tables.append(table_data)
-        return  # 테이블 내부는 별도 처리
-
-    # 단락 처리
-    if tag in ("p", "para", "paragraph"):
-        para_text = _extract_paragraph_text(element)
-        if para_text.strip():
-            paragraphs.append({
-                "text": para_text.strip(),
-                "level": current_level,
-            })
-        return  # 단락 내부 더 탐색 불필요
-
-    # 섹션/컨테이너는 재귀 탐색
-    for child in element:
-        _extract_structure_recursive(child, paragraphs, tables, current_level)
+    stack = [element]
+
+    while stack:
+        elem = stack.pop()
+        tag = _local_name(elem.tag)
+
+        # 테이블 처리
+        if tag in ("tbl", "table"):
+            table_data = _parse_hwpx_table(elem)
+            if table_data:
+                tables.append(table_data)
+            continue  # 테이블 내부는 별도 처리
+
+        # 단락 처리
+        if tag in ("p", "para", "paragraph"):
+            para_text = _extract_paragraph_text(elem).strip()
+            if para_text:
+                paragraphs.append({
+                    "text": para_text,
+                    "level": current_level,
+                })
+            continue  # 단락 내부 더 탐색 불필요
+
+        # 섹션/컨테이너: 자식을 역순으로 쌓아 문서 순서대로 꺼냄
+        stack.extend(reversed(elem))
 
 
 def _extract_paragraph_text(element: ET.Element) -> str:
@@ -463,23 +597,28 @@ def _extract_paragraph_text(element: ET.Element) -> str:
     </p>
     """
     texts = []
+    append = texts.append
+    local_name = _local_name
 
     # 요소 자체의 텍스트
-    if element.text and element.text.strip():
-        texts.append(element.text.strip())
+    if element.text:
+        text = element.text.strip()
+        if text:
+            append(text)
 
-    # 모든 하위 요소 순회
+    # 모든 하위 요소 순회 (iter()는 C 구현이라 Python 스택보다 빠름)
+    # 단락 안의 표(<run><tbl>)도 단락 텍스트에 포함되므로 하위 p/tbl에서 멈추지 않음
     for elem in element.iter():
-        tag = _get_local_tag(elem)
-
-        # <t> 태그는 텍스트 컨테이너
-        if tag == "t":
-            if elem.text:
-                texts.append(elem.text)
+        # <t> 태그는 텍스트 컨테이너 (텍스트가 있을 때만 태그명 확인)
+        if elem.text and local_name(elem.tag) == "t":
+            append(elem.text)
 
         # tail 텍스트 (닫는 태그 뒤 텍스트)
-        if elem.tail and elem.tail.strip():
-            texts.append(elem.tail.strip())
+        tail = elem.tail
+        if tail:
+            tail = tail.strip()
+            if tail:
+                append(tail)
 
     return "".join(texts)
 
@@ -0,0 +1,173 @@
+"""배치 처리 테스트"""
+
+import signal
+import time
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from hwp2yaml import batch
+from hwp2yaml.batch import BatchProcessor
+from hwp2yaml.models import ExtractResult
+
+
+FILES = [f"/data/{i}.hwp" for i in range(1, 7)]
+
+
+class _InlineExecutor:
+    """워커 풀 대신 현재 프로세스에서 실행 (fail_at번째 작업부터 BrokenProcessPool)"""
+
+    def __init__(self, fail_at: int | None = None):
+        self.fail_at = fail_at
+        self.calls = 0
+        self.shutdowns: list[bool] = []
+
+    def _run(self, fn, *args):
+        self.calls += 1
+        if self.fail_at is not None and self.calls >= self.fail_at:
+            raise BrokenProcessPool("worker died")
+        return fn(*args)
+
+    def map(self, fn, *iterables, chunksize=1):
+        return (self._run(fn, *args) for args in zip(*iterables))
+
+    def submit(self, fn, *args):
+        future = Future()
+        try:
+            future.set_result(self._run(fn, *args))
+        except BaseException as e:
+            future.set_exception(e)
+        return future
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        self.shutdowns.append(wait)
+
+
+def _ok_extract(filepath: str) -> ExtractResult:
+    return ExtractResult(filepath=filepath, success=True, text="본문", method="prvtext")
+
+
+@pytest.fixture
+def inline(monkeypatch):
+    """추출 함수를 성공 결과로 대체하고 인라인 실행기를 붙인 처리기 생성"""
+    monkeypatch.setattr(batch, "extract_hwp_text", _ok_extract)
+
+    def make(fail_at=None, mapper=None, workers=1):
+        processor = BatchProcessor(workers=workers, timeout=0, metadata_mapper=mapper)
+        executor = _InlineExecutor(fail_at)
+        processor._executor = executor
+        return processor, executor
+
+    return make
+
+
+def _failing_mapper(filepath: str) -> dict:
+    if filepath.endswith("/2.hwp"):
+        raise ValueError("boom")
+    return {"key": filepath}
+
+
+@pytest.mark.parametrize("as_list", [True, False])
+def test_mapper_error_fails_only_that_file(inline, as_list):
+    """매퍼 예외는 해당 파일만 실패 처리 (목록/이터러블 공통)"""
+    processor, _ = inline(mapper=_failing_mapper)
+    files = FILES if as_list else iter(FILES)
+
+    result = processor.process_files(files, progress=False)
+
+    assert result.total == 6
+    assert [r.filepath for r in result.results] == FILES
+    assert [r.success for r in result.results] == [True, False, True, True, True, True]
+    assert result.results[1].error == "boom"
+    assert result.results[2].external == {"key": FILES[2]}
+
+
+@pytest.mark.parametrize("as_list", [True, False])
+def test_broken_pool_fails_remaining_files(inline, as_list):
+    """워커 비정상 종료 시 남은 파일 실패 처리 후 풀 폐기"""
+    processor, executor = inline(fail_at=3)
+    files = FILES if as_list else iter(FILES)
+
+    result = processor.process_files(files, progress=False)
+
+    assert result.total == 6
+    assert [r.filepath for r in result.results] == FILES
+    assert [r.success for r in result.results] == [True, True, False, False, False, False]
+    assert result.results[-1].error == "worker died"
+    assert executor.shutdowns == [False]
+    assert processor._executor is None
+
+
+def test_stream_keeps_input_order():
+    """이터러블 입력은 실제 워커 풀에서도 입력 순서대로 결과 반환"""
+    files = [f"/nonexistent/{i}.hwp" for i in range(10)]
+
+    with BatchProcessor(workers=2, timeout=0) as processor:
+        results = list(processor.process_files_iter(iter(files), progress=False))
+
+    assert [r.filepath for r in results] == files
+    assert not any(r.success for r in results)
+
+
+def test_stream_bounds_in_flight(inline):
+    """진행 중인 작업은 워커 수의 2배 이하"""
+    processor, _ = inline(workers=2)
+    pulled = 0
+
+    def files():
+        nonlocal pulled
+        for filepath in [f"/data/{i}.hwp" for i in range(20)]:
+            pulled += 1
+            yield filepath
+
+    ahead = []
+    for done, _ in enumerate(processor.process_files_iter(files(), progress=False)):
+        ahead.append(pulled - done)
+
+    assert len(ahead) == 20
+    assert max(ahead) == 4
+
+
+def test_stream_failure_reports_pending_and_unsubmitted(inline):
+    """워커 비정상 종료 시 대기 중 파일과 미제출 파일 모두 실패 처리"""
+    processor, executor = inline(fail_at=3, workers=1)
+    files = [f"/data/{i}.hwp" for i in range(10)]
+    source = iter(files)
+
+    results = list(processor.process_files_iter(source, progress=False))
+
+    assert [r.filepath for r in results] == files
+    assert [r.success for r in results] == [True, True] + [False] * 8
+    # 4번째까지만 제출되고 나머지는 제출 없이 실패 처리
+    assert executor.calls == 4
+    assert next(source, None) is None
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGALRM"), reason="SIGALRM 미지원")
+def test_worker_timeout(monkeypatch):
+    """타임아웃 초과 시 실패 결과 반환, 알람은 해제된 상태"""
+    monkeypatch.setattr(batch, "extract_hwp_text", lambda filepath: time.sleep(5))
+    previous = signal.signal(signal.SIGALRM, batch._raise_timeout)
+    try:
+        result = batch._worker_extract("/data/slow.hwp", timeout=1)
+        assert signal.alarm(0) == 0
+    finally:
+        signal.signal(signal.SIGALRM, previous)
+
+    assert not result.success
+    assert result.error == "타임아웃 (1초)"
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGALRM"), reason="SIGALRM 미지원")
+def test_worker_disarms_alarm_on_success(monkeypatch):
+    """정상 추출 후 알람 해제"""
+    monkeypatch.setattr(batch, "extract_hwp_text", _ok_extract)
+    previous = signal.signal(signal.SIGALRM, batch._raise_timeout)
+    try:
+        result = batch._worker_extract("/data/1.hwp", timeout=30)
+        assert signal.alarm(0) == 0
+    finally:
+        signal.signal(signal.SIGALRM, previous)
+
+    assert result.success
@@ -0,0 +1,84 @@
+"""YAML 출력 테스트"""
+
+import json
+import os
+import subprocess
+import sys
+
+import yaml
+
+from hwp2yaml.exporter import YAMLExporter
+from hwp2yaml.models import ExtractResult
+
+
+def _result(filepath: str, text: str, success: bool = True) -> ExtractResult:
+    return ExtractResult(
+        filepath=filepath,
+        success=success,
+        text=text if success else None,
+        method="prvtext" if success else "failed",
+    )
+
+
+def test_export_batch_same_stem_keeps_last(tmp_path):
+    """파일명이 같은 결과는 마지막 결과로 저장"""
+    exporter = YAMLExporter(str(tmp_path / "out"))
+    results = [
+        _result("/a/123_0.hwp", "첫 번째 본문"),
+        _result("/a/456_0.hwp", "다른 문서"),
+        _result("/b/123_0.hwp", "두 번째 본문"),
+        _result("/c/789_0.hwp", "", success=False),
+    ] + [_result(f"/d/{i}.hwp", f"본문 {i}") for i in range(20)]
+
+    paths = exporter.export_batch(results, workers=2)
+
+    assert len(paths) == len(set(paths)) == 22
+    collided = tmp_path / "out" / "123_0.yaml"
+    assert str(collided) in paths
+    with open(collided, encoding="utf-8") as f:
+        assert yaml.safe_load(f)["content"] == "두 번째 본문"
+
+
+_JSON_SCRIPT = r"""
+import sys
+if sys.argv[1] == "std":
+    sys.modules["orjson"] = None  # orjson 미설치 환경 재현
+from hwp2yaml.batch import MetadataMapper
+from hwp2yaml.exporter import _dumps_json
+
+mapper = MetadataMapper(sys.argv[2])
+sys.stdout.buffer.write(_dumps_json({
+    "제목": "값\n\"따옴표\"", 1: [1.5, None, True], "mapped": mapper.get("/d/133695_0.hwp"),
+}))
+"""
+
+
+def _run_json(mode: str, metadata_file: str) -> bytes:
+    import hwp2yaml
+
+    src = os.path.dirname(os.path.dirname(hwp2yaml.__file__))
+    env = dict(os.environ, PYTHONPATH=src)
+    return subprocess.run(
+        [sys.executable, "-c", _JSON_SCRIPT, mode, metadata_file],
+        capture_output=True, check=True, env=env,
+    ).stdout
+
+
+def test_json_output_same_without_orjson(tmp_path):
+    """orjson 설치 여부와 무관하게 같은 JSON 출력, 잘못된 메타데이터 줄은 건너뜀"""
+    metadata_file = tmp_path / "metadata.jsonl"
+    metadata_file.write_bytes(
+        b'{"article_id": 133695, "title": "\xec\xa0\x9c\xeb\xaa\xa9"}\n'
+        b'not json\n'
+        b'{"filename": "\xff\xfe.hwp"}\n'
+        b'\n'
+    )
+
+    fast = _run_json("fast", str(metadata_file))
+
+    assert fast == _run_json("std", str(metadata_file))
+    assert json.loads(fast) == {
+        "제목": "값\n\"따옴표\"", "1": [1.5, None, True],
+        "mapped": {"article_id": 133695, "title": "제목"},
+    }
+    assert b", " not in fast
@@ -23,3 +23,48 @@ def test_extract_result_dataclass():
     )
     assert result.char_count == 7
     assert result.filepath == "/test.hwp"
+
+
+class _StubReader:
+    """PrvText 스트림만 제공하는 리더"""
+
+    filepath = "/test.hwp"
+
+    def __init__(self, data: bytes):
+        self._data = data
+
+    def has_stream(self, name: str) -> bool:
+        return True
+
+    def open_stream(self, name: str) -> bytes:
+        return self._data
+
+
+@pytest.mark.parametrize("data", [
+    "AB".encode("utf-16-le") + b"\x00" * 4,
+    "AB".encode("utf-16-le") + b"\x00",
+    "AB".encode("utf-16-le") + b"\x00" * 3,
+])
+def test_prvtext_trailing_null_padding(data):
+    """끝부분 널 패딩 길이와 무관하게 마지막 문자 유지"""
+    from hwp2yaml.extractor import TextExtractor
+
+    assert TextExtractor(_StubReader(data))._extract_prvtext() == "AB"
+
+
+def test_non_hwpx_zip_reports_unsupported_format(tmp_path):
+    """HWPX가 아닌 ZIP은 HWPX 경로로 보내지 않고 HWP 리더 오류로 처리"""
+    import zipfile
+    from hwp2yaml.extractor import extract_hwp_structure
+
+    path = tmp_path / "plain.hwp"
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("readme.txt", "not hwpx")
+
+    result = extract_hwp_text(str(path))
+    structured = extract_hwp_structure(str(path))
+
+    assert not result.success
+    assert result.error.startswith("OLE 파일 열기 실패")
+    assert not structured.success
+    assert structured.error.startswith("OLE 파일 열기 실패")
@@ -0,0 +1,255 @@
+"""HWP 3.x 변환기 테스트"""
+
+import gc
+import gzip
+import os
+import subprocess
+
+import pytest
+import yaml
+
+from hwp2yaml import hwp3_converter
+from hwp2yaml.hwp3_converter import ConversionResult, HWP3Converter, _write_yaml_file
+
+
+def _converter(**attrs) -> HWP3Converter:
+    """LibreOffice 확인 없이 변환기 생성"""
+    converter = HWP3Converter.__new__(HWP3Converter)
+    converter.libreoffice_path = converter._libreoffice_bin = "soffice"
+    converter.keep_pdf = False
+    converter.pdf_output_dir = None
+    converter.profile_dir = None
+    converter._tmpdir = None
+    converter._tmpdir_finalizer = None
+    converter._docling_available = False
+    for name, value in attrs.items():
+        setattr(converter, name, value)
+    return converter
+
+
+def test_cleanup_pdf_keeps_caller_dir(tmp_path):
+    """호출측 pdf_output_dir은 비어도 삭제하지 않음"""
+    pdf_dir = tmp_path / "pdf"
+    converter = _converter(pdf_output_dir=str(pdf_dir))
+    output_dir = converter._make_output_dir()
+    pdf_path = pdf_dir / "doc.pdf"
+    pdf_path.write_bytes(b"%PDF")
+
+    converter._cleanup_pdf(str(pdf_path))
+
+    assert output_dir == str(pdf_dir)
+    assert not pdf_path.exists()
+    assert pdf_dir.is_dir()
+
+
+def test_write_yaml_raw_text_sidecar(tmp_path):
+    """raw_text_sidecar이면 원문은 YAML에서 빠지고 .txt.gz로 저장"""
+    text = "제1조 목적\n이 규정은 테스트를 위한 것이다."
+    data = ConversionResult(filepath="/data/123_0.hwp", success=True, text=text).to_yaml_dict()
+    path = tmp_path / "123.yaml"
+
+    _write_yaml_file(str(path), data, raw_text_sidecar=True)
+
+    with open(path, encoding="utf-8") as f:
+        written = yaml.safe_load(f)
+    assert "raw_text" not in written
+    assert "raw_text" in data
+    with gzip.open(tmp_path / "123.txt.gz", "rt", encoding="utf-8") as f:
+        assert f.read() == data["raw_text"] == text
+
+
+class _FakeRun:
+    """
+    subprocess.run 대체
+
+    LibreOffice는 입력 파일 내용을 그대로 <이름>.pdf로 저장, pdftotext는 PDF 내용 출력
+    """
+
+    def __init__(self, fail=(), returncode=0, stop_after=None):
+        self.fail = set(fail)  # PDF를 만들지 않을 파일명
+        self.returncode = returncode
+        self.stop_after = stop_after  # 묶음 변환에서 n개 변환 후 시간 초과
+        self.calls: list[list[str]] = []  # LibreOffice 호출별 입력 파일
+        self.timeouts: list[int] = []
+
+    def __call__(self, command, **kwargs):
+        if command[0] == "pdftotext":
+            with open(command[-2], "rb") as f:
+                return subprocess.CompletedProcess(command, 0, f.read(), b"")
+
+        outdir = command[command.index("--outdir") + 1]
+        files = command[command.index("--outdir") + 2:]
+        self.calls.append(files)
+        self.timeouts.append(kwargs["timeout"])
+        batch = len(files) > 1
+        for n, filepath in enumerate(files):
+            if batch and self.stop_after is not None and n == self.stop_after:
+                raise subprocess.TimeoutExpired(command, kwargs["timeout"])
+            name = os.path.basename(filepath)
+            if name in self.fail:
+                continue
+            pdf_name = os.path.splitext(name)[0] + ".pdf"
+            with open(filepath, "rb") as src, open(os.path.join(outdir, pdf_name), "wb") as dst:
+                dst.write(src.read())
+        return subprocess.CompletedProcess(command, self.returncode if batch else 0, "", "")
+
+
+@pytest.fixture
+def fake_run(monkeypatch):
+    def install(**kwargs) -> _FakeRun:
+        run = _FakeRun(**kwargs)
+        monkeypatch.setattr(hwp3_converter.subprocess, "run", run)
+        return run
+    return install
+
+
+def _inputs(tmp_path, names) -> list[str]:
+    """파일 내용이 곧 추출 텍스트가 되는 입력 파일 생성"""
+    paths = []
+    for name in names:
+        path = tmp_path / "in" / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(f"본문 {name}", encoding="utf-8")
+        paths.append(str(path))
+    return paths
+
+
+def test_convert_many_ignores_stale_pdf(tmp_path, fake_run):
+    """이전 실행에서 남은 PDF는 이번 변환 성공으로 보지 않음"""
+    pdf_dir = tmp_path / "pdf"
+    pdf_dir.mkdir()
+    (pdf_dir / "b.pdf").write_text("이전 본문", encoding="utf-8")
+    run = fake_run(fail={"b.hwp"})
+    converter = _converter(keep_pdf=True, pdf_output_dir=str(pdf_dir))
+
+    results = converter.convert_many(_inputs(tmp_path, ["a.hwp", "b.hwp"]), verify_version=False)
+
+    assert results[0].text == "본문 a.hwp"
+    assert not results[1].success
+    assert "PDF 파일 생성 실패" in results[1].error
+    # b는 묶음 변환 후 개별 변환으로 재시도
+    assert [len(files) for files in run.calls] == [2, 1]
+
+
+def test_convert_many_crashed_run_falls_back(tmp_path, fake_run):
+    """LibreOffice 비정상 종료 시 전체 파일 개별 변환"""
+    run = fake_run(returncode=1)
+    converter = _converter(pdf_output_dir=str(tmp_path / "pdf"))
+
+    results = converter.convert_many(_inputs(tmp_path, ["a.hwp", "b.hwp"]), verify_version=False)
+
+    assert [r.text for r in results] == ["본문 a.hwp", "본문 b.hwp"]
+    assert [len(files) for files in run.calls] == [2, 1, 1]
+
+
+def test_convert_many_timeout_is_capped(tmp_path, fake_run):
+    """묶음 제한 시간은 상한 적용, 시간 초과 시 미완료 파일과 마지막 PDF는 개별 변환"""
+    run = fake_run(stop_after=3)
+    converter = _converter(pdf_output_dir=str(tmp_path / "pdf"))
+    names = [f"{i}.hwp" for i in range(10)]
+
+    results = converter.convert_many(_inputs(tmp_path, names), verify_version=False)
+
+    assert [r.text for r in results] == [f"본문 {name}" for name in names]
+    assert run.timeouts[0] == hwp3_converter._PDF_BATCH_TIMEOUT_SECONDS
+    # 0, 1번만 묶음 결과 사용 (2번은 작성 중이었을 수 있음)
+    assert [files[0] for files in run.calls[1:]] == [
+        str(tmp_path / "in" / name) for name in names[2:]
+    ]
+
+
+def test_convert_many_keeps_input_order(tmp_path, fake_run, monkeypatch):
+    """버전 확인 실패/개별 변환 파일이 섞여도 결과는 입력 순서"""
+    run = fake_run(fail={"c.hwp"})
+    converter = _converter(pdf_output_dir=str(tmp_path / "pdf"))
+    not_hwp3 = ConversionResult(filepath="", success=False, error="HWP 3.x가 아님: hwp5")
+    monkeypatch.setattr(
+        converter, "_check_version",
+        lambda fp: not_hwp3 if fp.endswith("b.hwp") else None,
+    )
+    paths = _inputs(tmp_path, ["d.hwp", "b.hwp", "c.hwp", "a.hwp"])
+
+    results = converter.convert_many(paths)
+
+    assert [r.text for r in results] == ["본문 d.hwp", None, None, "본문 a.hwp"]
+    assert results[1] is not_hwp3
+    assert "PDF 파일 생성 실패" in results[2].error
+    # 버전 확인 실패 파일은 변환하지 않음
+    assert [files for files in run.calls] == [[paths[0], paths[2], paths[3]], [paths[2]]]
+
+
+def test_convert_many_duplicate_stem_converted_individually(tmp_path, fake_run):
+    """PDF 이름이 겹치는 파일은 묶음에서 빼고 개별 변환"""
+    run = fake_run()
+    converter = _converter(pdf_output_dir=str(tmp_path / "pdf"))
+    paths = _inputs(tmp_path, ["x/doc.hwp", "y/doc.hwp", "other.hwp"])
+
+    results = converter.convert_many(paths, verify_version=False)
+
+    assert [r.text for r in results] == ["본문 x/doc.hwp", "본문 y/doc.hwp", "본문 other.hwp"]
+    assert run.calls == [[paths[0], paths[2]], [paths[1]]]
+
+
+def test_convert_many_missing_pdf_uses_convert_single(tmp_path, fake_run, monkeypatch):
+    """묶음 변환에서 PDF가 없는 파일만 _convert_single로 처리"""
+    fake_run(fail={"b.hwp"})
+    converter = _converter(pdf_output_dir=str(tmp_path / "pdf"))
+    single = []
+    monkeypatch.setattr(
+        converter, "_convert_single",
+        lambda fp: single.append(fp) or ConversionResult(filepath=fp, success=False),
+    )
+    paths = _inputs(tmp_path, ["a.hwp", "b.hwp", "c.hwp"])
+
+    results = converter.convert_many(paths, verify_version=False)
+
+    assert single == [paths[1]]
+    assert [r.success for r in results] == [True, False, True]
+
+
+def test_split_chunks_keeps_same_stem_together():
+    """PDF 이름이 같은 파일은 같은 묶음 (모든 인덱스는 정확히 1회)"""
+    paths = [f"/d{i % 4}/{name}.hwp" for i, name in enumerate("aabcabcddea")]
+
+    chunks = hwp3_converter._split_chunks(paths, 2)
+
+    assert sorted(i for chunk in chunks for i in chunk) == list(range(len(paths)))
+    owner = {}
+    for n, chunk in enumerate(chunks):
+        for i in chunk:
+            stem = os.path.basename(paths[i])
+            assert owner.setdefault(stem, n) == n
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_batch_convert_without_libreoffice(monkeypatch, workers):
+    """LibreOffice가 없으면 워커 수와 무관하게 RuntimeError"""
+    monkeypatch.setattr(hwp3_converter.shutil, "which", lambda name: None)
+
+    with pytest.raises(RuntimeError, match="LibreOffice를 찾을 수 없습니다"):
+        hwp3_converter.batch_convert_hwp3(
+            ["/data/a.hwp", "/data/b.hwp"], progress=False, workers=workers,
+        )
+
+
+def test_tmpdir_removed_without_close():
+    """close() 없이 버려진 변환기의 임시 디렉토리도 삭제"""
+    converter = _converter()
+    tmpdir = converter._make_output_dir()
+    assert os.path.isdir(tmpdir)
+
+    del converter
+    gc.collect()
+
+    assert not os.path.exists(tmpdir)
+
+
+def test_close_removes_tmpdir():
+    """close()는 임시 디렉토리를 즉시 삭제 (중복 호출 허용)"""
+    converter = _converter()
+    tmpdir = converter._make_output_dir()
+
+    converter.close()
+    converter.close()
+
+    assert not os.path.exists(tmpdir)
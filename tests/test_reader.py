@@ -0,0 +1,62 @@
+"""HWP 리더 테스트"""
+
+import io
+import zlib
+
+import pytest
+
+from hwp2yaml.constants import FLAG_COMPRESSED, HWP_SIGNATURE, STREAM_FILE_HEADER
+from hwp2yaml.reader import HWPReader
+
+
+def _deflate(data: bytes) -> bytes:
+    compressor = zlib.compressobj(wbits=-15)
+    return compressor.compress(data) + compressor.flush()
+
+
+class _StubOle:
+    """exists/openstream만 제공하는 OLE 대체"""
+
+    def __init__(self, streams: dict[str, bytes]):
+        self._streams = streams
+
+    def exists(self, name: str) -> bool:
+        return name in self._streams
+
+    def openstream(self, name: str):
+        return io.BytesIO(self._streams[name])
+
+
+def _reader(compressed: bool) -> HWPReader:
+    """OLE 파일 없이 섹션 스트림만 가진 리더 생성"""
+    flags = FLAG_COMPRESSED if compressed else 0
+    header = HWP_SIGNATURE.ljust(36, b"\x00") + flags.to_bytes(4, "little")
+    sections = [f"섹션 {i} 본문".encode("utf-16-le") * (i + 1) for i in range(4)]
+    streams = {STREAM_FILE_HEADER: header}
+    for i, data in enumerate(sections):
+        # 압축 플래그가 있어도 해제 실패 섹션은 원본 유지
+        if compressed and i != 2:
+            data = _deflate(data)
+        streams[f"BodyText/Section{i}"] = data
+
+    reader = HWPReader.__new__(HWPReader)
+    reader.filepath = "/test.hwp"
+    reader._ole = _StubOle(streams)
+    reader._metadata = None
+    reader._file_header = None
+    reader._flags = None
+    reader._version = None
+    return reader
+
+
+@pytest.mark.parametrize("compressed", [True, False])
+@pytest.mark.parametrize("workers", [1, 2])
+def test_read_sections_matches_iter_sections(compressed, workers):
+    """read_sections 결과는 워커 수와 무관하게 iter_sections와 동일"""
+    reader = _reader(compressed)
+
+    sections = reader.read_sections(workers=workers)
+
+    assert sections == list(reader.iter_sections())
+    assert [name for name, _ in sections] == [f"BodyText/Section{i}" for i in range(4)]
+    assert sections[3][1] == "섹션 3 본문".encode("utf-16-le") * 4
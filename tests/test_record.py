@@ -0,0 +1,185 @@
+"""HWP 레코드 파서 테스트"""
+
+import pytest
+from hwp2yaml.record import RecordParser
+from hwp2yaml.structure import StructureParser
+from hwp2yaml.constants import HWPTAG_PARA_HEADER, HWPTAG_PARA_TEXT, DEFAULT_ENCODING
+
+
+def u16(text: str) -> bytes:
+    return text.encode(DEFAULT_ENCODING, "surrogatepass")
+
+
+def make_record_bytes(tag_id: int, data: bytes, level: int = 0, extended: bool = False) -> bytes:
+    """테스트용 레코드 바이트 생성 (extended면 크기와 무관하게 확장 크기 헤더 사용)"""
+    size = len(data)
+    if extended or size > 0xFFE:
+        header_val = tag_id | (level << 10) | (0xFFF << 20)
+        return header_val.to_bytes(4, "little") + size.to_bytes(4, "little") + data
+    header_val = tag_id | (level << 10) | (size << 20)
+    return header_val.to_bytes(4, "little") + data
+
+
+def para_text(text: str, **kwargs) -> bytes:
+    return make_record_bytes(HWPTAG_PARA_TEXT, u16(text), **kwargs)
+
+
+# 확장 제어 문자 (코드 + 추가 데이터 7글자 = 8 WCHAR)
+def inline_ctrl(code: int) -> str:
+    return chr(code) + "tbl " + chr(0) * 2 + chr(code)
+
+
+class TestDecodeParaText:
+    """RecordParser._decode_para_text 제어 문자 처리"""
+
+    decode = staticmethod(RecordParser._decode_para_text)
+
+    @pytest.mark.parametrize("code", [0x01, 0x02, 0x03, 0x0B, 0x0C])
+    def test_extended_ctrl_skips_extra_8_chars(self, code):
+        """확장 제어 문자는 제어 문자 + 8글자 추가 데이터 스킵"""
+        data = u16("앞" + inline_ctrl(code) + "X뒤")
+        assert self.decode(data) == "앞뒤"
+
+    def test_char_controls(self):
+        """탭/줄바꿈/단락 구분은 유지, 그 외 1글자 제어 문자는 제거"""
+        data = u16("가\t나\n다\x00\x04\x1f라\r")
+        assert self.decode(data) == "가\t나\n다라"
+
+    def test_para_break_only_fast_path(self):
+        """탭/줄바꿈/단락 구분만 있는 레코드"""
+        assert self.decode(u16(" 첫 줄\r둘째\t줄\r")) == "첫 줄\n둘째\t줄"
+
+    def test_truncated_trailing_ctrl(self):
+        """끝부분에서 잘린 확장 제어 문자는 남은 글자만 스킵"""
+        assert self.decode(u16("본문" + chr(0x0B) + "tb")) == "본문"
+
+    def test_lone_surrogate(self):
+        """짝 없는 서로게이트는 대체 문자로 디코딩"""
+        assert self.decode(u16("가\ud800나")) == "가�나"
+
+    def test_odd_length(self):
+        """홀수 바이트 데이터의 마지막 바이트는 대체 문자"""
+        assert self.decode(u16("가나") + b"A") == "가나�"
+
+    def test_memoryview(self):
+        """memoryview 입력도 bytes와 같은 결과"""
+        data = u16("가" + inline_ctrl(0x02) + "X나\r")
+        assert self.decode(memoryview(data)) == self.decode(data) == "가나"
+
+    def test_empty(self):
+        assert self.decode(b"") == ""
+
+
+class TestStructureDecodeParaText:
+    """StructureParser._decode_para_text 제어 문자 처리"""
+
+    @pytest.mark.parametrize("code", [0x01, 0x04, 0x08, 0x0B, 0x0C, 0x15, 0x19])
+    def test_extended_ctrl_skips_8_chars(self, code):
+        """확장 제어 문자는 제어 문자 포함 8 WCHAR 스킵"""
+        data = u16("앞" + inline_ctrl(code) + "뒤")
+        assert StructureParser()._decode_para_text(data) == "앞뒤"
+
+    def test_char_controls(self):
+        data = u16("가\t나\n다\x00\x1f라\r")
+        assert StructureParser()._decode_para_text(data) == "가\t나\n다라"
+
+    def test_truncated_trailing_ctrl(self):
+        data = u16("본문" + chr(0x15) + "ab")
+        assert StructureParser()._decode_para_text(data) == "본문"
+
+
+class TestIterRecords:
+    """레코드 순회"""
+
+    def test_extended_size_header(self):
+        """Size == 0xFFF이면 추가 4바이트의 실제 크기 사용"""
+        data = para_text("확장", extended=True) + para_text("다음")
+
+        records = list(RecordParser.iter_records(data))
+
+        assert [r.header.size for r in records] == [4, 4]
+        assert bytes(records[0].data) == u16("확장")
+        assert bytes(records[1].data) == u16("다음")
+
+    def test_large_record(self):
+        """0xFFF 바이트 이상 레코드"""
+        text = "가" * 3000
+        records = list(RecordParser.iter_records(para_text(text)))
+        assert len(records) == 1
+        assert records[0].header.size == 6000
+        assert RecordParser.extract_text_from_section(para_text(text)) == text
+
+    def test_truncated_final_record(self):
+        """마지막 레코드 데이터가 부족하면 남은 부분만 사용"""
+        data = para_text("첫째") + para_text("잘린 문단")[:-4]
+
+        records = list(RecordParser.iter_records(data))
+        payloads = list(RecordParser._iter_para_text_data(data))
+
+        assert [bytes(r.data) for r in records] == [bytes(p) for p in payloads]
+        assert bytes(records[1].data) == u16("잘린 ")
+        assert RecordParser.extract_text_from_section(data) == "첫째\n잘린"
+
+    def test_truncated_header(self):
+        """헤더가 잘린 경우 (일반/확장 크기) 순회 종료"""
+        complete = para_text("본문")
+        for tail in (b"\x43\x00", (0x43 | (0xFFF << 20)).to_bytes(4, "little") + b"\x01"):
+            data = complete + tail
+            assert len(list(RecordParser.iter_records(data))) == 1
+            assert len(list(RecordParser._iter_para_text_data(data))) == 1
+
+    def test_skips_other_records(self):
+        """PARA_TEXT 외 레코드는 텍스트 추출에서 제외"""
+        data = (
+            make_record_bytes(HWPTAG_PARA_HEADER, b"\x00" * 22)
+            + para_text("본문")
+            + make_record_bytes(HWPTAG_PARA_HEADER, u16("헤더"), extended=True)
+            + para_text("둘째", level=1)
+        )
+
+        tags = [r.header.tag_id for r in RecordParser.iter_records(data)]
+        payloads = [bytes(p) for p in RecordParser._iter_para_text_data(memoryview(data))]
+
+        assert tags == [HWPTAG_PARA_HEADER, HWPTAG_PARA_TEXT] * 2
+        assert payloads == [u16("본문"), u16("둘째")]
+        assert RecordParser.extract_text_from_section(data) == "본문\n둘째"
+
+    def test_memoryview_records(self):
+        """memoryview 입력은 복사 없는 memoryview 레코드 데이터"""
+        data = para_text("본문")
+        record = next(RecordParser.iter_records(memoryview(data)))
+        assert isinstance(record.data, memoryview)
+        assert record.data == u16("본문")
+
+
+class TestExtractAllText:
+    """섹션/문단 구분자"""
+
+    def test_separators(self):
+        """문단은 줄바꿈 1개, 섹션은 2개, 빈 문단/빈 섹션은 구분자 없음"""
+        sections = [
+            ("BodyText/Section0", para_text("") + para_text("가") + para_text("\r") + para_text("나")),
+            ("BodyText/Section1", para_text(" ") + make_record_bytes(HWPTAG_PARA_HEADER, b"\x00" * 22)),
+            ("BodyText/Section2", b""),
+            ("BodyText/Section3", para_text("다\r") + para_text(inline_ctrl(0x0B))),
+            ("BodyText/Section4", para_text("라")),
+        ]
+
+        assert RecordParser.extract_all_text(sections) == "가\n나\n\n다\n\n라"
+
+    def test_matches_section_join(self):
+        """섹션별 추출 결과를 빈 섹션 제외 후 빈 줄로 연결한 것과 동일"""
+        sections = [
+            ("BodyText/Section0", para_text("첫째") + para_text("둘째")),
+            ("BodyText/Section1", para_text("")),
+            ("BodyText/Section2", para_text("셋째\t탭") + para_text("넷째\n줄")),
+        ]
+
+        texts = [RecordParser.extract_text_from_section(data) for _, data in sections]
+        expected = "\n\n".join(text for text in texts if text)
+
+        assert RecordParser.extract_all_text(sections) == expected
+
+    def test_empty(self):
+        assert RecordParser.extract_all_text([]) == ""
+        assert RecordParser.extract_all_text([("BodyText/Section0", para_text(""))]) == ""
@@ -242,3 +242,20 @@ class TestTableToDict:
         assert d["cols"] == 2
         assert d["data"][0][0] == "A"
         assert d["data"][1][1] == "D"
+
+
+class TestExtractHwp5Structure:
+    """섹션 병렬 파싱 테스트"""
+
+    def test_parallel_matches_serial(self):
+        """workers > 1 결과가 순차 처리와 동일 (섹션 순서 유지)"""
+        sections = []
+        for i in range(3):
+            data = make_para_header(0) + make_para_text(0, f"Section {i}")
+            sections.append((f"Section{i}", data))
+
+        serial = extract_hwp5_structure(sections)
+        parallel = extract_hwp5_structure(sections, workers=2)
+
+        assert parallel.to_dict() == serial.to_dict()
+        assert [s.index for s in parallel.sections] == [0, 1, 2]
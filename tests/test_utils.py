@@ -7,11 +7,14 @@ from hwp2yaml.utils import (
     _strip_namespaces_safe,
     _extract_text_preserving_whitespace,
     _parse_hwpx_section,
+    _stream_hwpx_section_text,
     _parse_hwpx_section_structure,
     convert_table_tags_to_markdown,
     clean_text,
+    iter_hwp_files,
 )
 import xml.etree.ElementTree as ET
+import zipfile
 
 
 class TestSectionOrdering:
@@ -111,6 +114,22 @@ class TestNamespaceParsing:
         if texts:
             assert "spaced" in texts[0]
 
+    def test_stream_section_text_matches_tree_parse(self, tmp_path):
+        """SAX 스트리밍 추출 결과가 트리 파싱과 동일"""
+        xml = (
+            '<hs:sec xmlns:hs="http://www.hancom.co.kr/hwpml/2011/section">'
+            '<hs:p> a <hs:t xml:space="preserve">  b  </hs:t> c </hs:p>'
+            '<hs:p><hs:t>가나</hs:t>다</hs:p></hs:sec>'
+        )
+        path = tmp_path / "doc.hwpx"
+        with zipfile.ZipFile(path, "w") as zf:
+            zf.writestr("Contents/section0.xml", xml)
+            zf.writestr("Contents/section1.xml", "<p><t>깨진")
+
+        with zipfile.ZipFile(path) as zf:
+            assert _stream_hwpx_section_text(zf, "Contents/section0.xml") == _parse_hwpx_section(xml)
+            assert _stream_hwpx_section_text(zf, "Contents/section1.xml") == ""
+
 
 class TestParseHwpxSectionStructure:
     """HWPX 섹션 구조 파싱 테스트"""
@@ -182,3 +201,26 @@ class TestCleanText:
         result = clean_text(text)
         assert "\x00" not in result
         assert "\x08" not in result
+
+
+class TestIterHwpFiles:
+    """HWP 파일 순회 테스트"""
+
+    def test_recursive(self, tmp_path):
+        """하위 디렉토리 포함, .hwp만 수집"""
+        (tmp_path / "a.hwp").write_bytes(b"")
+        (tmp_path / "b.txt").write_bytes(b"")
+        sub = tmp_path / "sub"
+        sub.mkdir()
+        (sub / "c.HWP").write_bytes(b"")
+        result = sorted(iter_hwp_files(str(tmp_path)))
+        assert result == [str(tmp_path / "a.hwp"), str(sub / "c.HWP")]
+
+    def test_non_recursive(self, tmp_path):
+        """하위 디렉토리 제외"""
+        (tmp_path / "a.hwp").write_bytes(b"")
+        sub = tmp_path / "sub"
+        sub.mkdir()
+        (sub / "c.hwp").write_bytes(b"")
+        result = list(iter_hwp_files(str(tmp_path), recursive=False))
+        assert result == [str(tmp_path / "a.hwp")]